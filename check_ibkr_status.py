@@ -15,11 +15,13 @@ import asyncio
 import os
 from dotenv import load_dotenv
 from src.execution import ExecutionEngine
+from src.logging import setup_console_logging
 
 
 async def main():
     # Load environment
     load_dotenv()
+    setup_console_logging()
 
     # Get IBKR connection details
     host = os.getenv("IBKR_HOST", "127.0.0.1")
@@ -53,4 +55,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Optional uvloop event loop (libuv) - must be installed before asyncio.run
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
@@ -1,10 +1,17 @@
 from .listener_simple import DiscordSimpleListener
-from .listener_websocket import DiscordWebSocketListener
 
 # Use Simple listener (JSON encoding - proven working from DiscordTelegramRouter)
 DiscordListener = DiscordSimpleListener
 
-# Old zlib-based listener available as fallback
+# Old zlib-based listener available as fallback (imported on first access only)
 # DiscordListener = DiscordWebSocketListener
 
+
+def __getattr__(name):
+    if name == "DiscordWebSocketListener":
+        from .listener_websocket import DiscordWebSocketListener
+        return DiscordWebSocketListener
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["DiscordListener", "DiscordSimpleListener", "DiscordWebSocketListener"]
@@ -6,10 +6,21 @@ This uses plain JSON instead of zlib compression for better reliability.
 
 import asyncio
 import json
+import logging
+import re
 import aiohttp
+import orjson
 from datetime import datetime, timezone
 from typing import Callable, List, Optional
 
+logger = logging.getLogger(__name__)
+
+# Shared read-only default for missing nested objects
+_EMPTY: dict = {}
+
+# Top-level dispatch sequence number in a raw gateway frame
+_SEQ_RE = re.compile(r'"s"\s*:\s*(\d+)')
+
 
 class DiscordSimpleListener:
     """
@@ -18,6 +29,9 @@ class DiscordSimpleListener:
     Based on proven working code from DiscordTelegramRouter.
     """
 
+    # Heartbeat round-trip above this means the loop or link is degraded
+    LATENCY_WARN_SECONDS = 1.0
+
     def __init__(
         self,
         token: str,
@@ -27,9 +41,19 @@ class DiscordSimpleListener:
     ):
         self.token = token
         self.channel_ids = set(channel_ids)
+        self.channel_id_strs = frozenset(str(cid) for cid in self.channel_ids)  # Wire format (snowflake strings)
         self.monitored_users = set(monitored_users) if monitored_users else None
         self.message_callback = message_callback
 
+        # Raw-frame needles for filtering before JSON parse (compact JSON, the
+        # gateway's format; usernames both raw UTF-8 and \u-escaped)
+        self._channel_id_needles = tuple(f'"channel_id":"{cid}"' for cid in self.channel_id_strs)
+        self._user_needles = tuple({
+            f'"username":{encoded}'
+            for user in self.monitored_users
+            for encoded in (orjson.dumps(user).decode(), json.dumps(user))
+        }) if self.monitored_users else ()
+
         # Gateway state
         self.session_id = None
         self.sequence = None
@@ -39,47 +63,101 @@ class DiscordSimpleListener:
         self.heartbeat_task = None
         self.running = False
 
+        # Gateway round-trip (HEARTBEAT -> HEARTBEAT_ACK), loop.time() based
+        self._last_heartbeat_sent: Optional[float] = None
+        self._latency: Optional[float] = None
+
+        # Callback dispatch (tasks held so they aren't garbage collected)
+        self._callback_lock = asyncio.Lock()
+        self._callback_tasks: set[asyncio.Task] = set()
+
         # User info
         self.user_id = None
         self.user_name = None
 
+    @property
+    def latency(self) -> Optional[float]:
+        """Last measured gateway heartbeat round-trip in seconds (None until first ACK)."""
+        return self._latency
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """
+        The listener's HTTP session, created on first use.
+
+        One session serves REST calls and every gateway reconnect, so DNS
+        results and TLS sessions stay warm. Must be called on the running loop.
+        """
+        if self.http_session is None or self.http_session.closed:
+            self.http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ttl_dns_cache=300, limit=0)
+            )
+        return self.http_session
+
     async def get_user_info(self) -> bool:
         """Verify Discord token and get user info."""
+        return await self._request_user_info() == 200
+
+    async def _request_user_info(self) -> Optional[int]:
+        """Fetch /users/@me. Returns the HTTP status, or None on network error."""
         headers = {"authorization": self.token}
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    "https://discord.com/api/v10/users/@me",
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        self.user_id = data.get('id')
-                        self.user_name = data.get('username')
-                        print(f"Discord logged in as {self.user_name}")
-                        return True
-                    else:
-                        print(f"Discord authentication failed: HTTP {resp.status}")
-                        return False
+            async with self._get_http_session().get(
+                "https://discord.com/api/v10/users/@me",
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json(loads=orjson.loads)
+                    self.user_id = data.get('id')
+                    self.user_name = data.get('username')
+                    logger.info("Discord logged in as %s", self.user_name)
+                else:
+                    logger.error("Discord authentication failed: HTTP %s", resp.status)
+                return resp.status
         except Exception as e:
-            print(f"Error getting Discord user info: {e}")
-            return False
+            logger.error("Error getting Discord user info: %s", e)
+            return None
+
+    async def _authenticate(self, max_attempts: int = 10) -> bool:
+        """
+        Verify the token, retrying transient failures with backoff.
+
+        401/403 mean the token itself is bad, so those fail immediately;
+        timeouts, network errors and 5xx are retried like gateway reconnects.
+        """
+        attempts = 0
+        while self.running:
+            status = await self._request_user_info()
+            if status == 200:
+                return True
+            if status in (401, 403):
+                return False
+
+            attempts += 1
+            if attempts > max_attempts:
+                return False
+
+            wait_time = min(5 * attempts, 60)
+            logger.warning("Discord auth attempt %d/%d failed, retrying in %d seconds...", attempts, max_attempts, wait_time)
+            await asyncio.sleep(wait_time)
+
+        return False
 
     async def start(self):
         """Connect to Discord gateway with auto-reconnect."""
         self.running = True
 
-        # Verify token first
-        if not await self.get_user_info():
-            print("Failed to authenticate with Discord. Check your token.")
+        # Verify token first (transient failures are retried)
+        if not await self._authenticate():
+            logger.error("Failed to authenticate with Discord. Check your token.")
+            await self.stop()  # Closes the HTTP session _authenticate opened
             return
 
-        print(f"Monitoring {len(self.channel_ids)} Discord channel(s)")
+        logger.info("Monitoring %d Discord channel(s)", len(self.channel_ids))
         if self.monitored_users:
-            print(f"Monitoring users: {list(self.monitored_users)}")
+            logger.info("Monitoring users: %s", list(self.monitored_users))
         else:
-            print("Monitoring all users")
+            logger.info("Monitoring all users")
 
         reconnect_attempts = 0
         max_reconnect_attempts = 10
@@ -87,22 +165,17 @@ class DiscordSimpleListener:
         while self.running:
             try:
                 gateway_url = "wss://gateway.discord.gg"
-                print(f"Connecting to Discord gateway...")
-
-                # Create session
-                connector = aiohttp.TCPConnector()
-                session = aiohttp.ClientSession(connector=connector)
-                self.http_session = session
+                logger.info("Connecting to Discord gateway...")
 
                 try:
                     # Connect with JSON encoding (no compression!)
-                    async with session.ws_connect(
+                    async with self._get_http_session().ws_connect(
                         f"{gateway_url}?v=10&encoding=json",
                         autoping=False,
                         max_msg_size=0  # No size limit
                     ) as ws:
                         self.ws = ws
-                        print("Connected to Discord gateway")
+                        logger.info("Connected to Discord gateway")
                         reconnect_attempts = 0  # Reset on successful connection
 
                         # Send IDENTIFY
@@ -112,19 +185,25 @@ class DiscordSimpleListener:
                         async for msg in ws:
                             try:
                                 if msg.type == aiohttp.WSMsgType.TEXT:
-                                    data = json.loads(msg.data)
+                                    if self._should_skip_frame(msg.data):
+                                        # Skipped dispatches still advance the heartbeat sequence
+                                        seq = self._frame_sequence(msg.data)
+                                        if seq is not None:
+                                            self.sequence = seq
+                                        continue
+                                    data = orjson.loads(msg.data)
                                     await self._handle_gateway_event(data)
                                 elif msg.type == aiohttp.WSMsgType.ERROR:
-                                    print(f"WebSocket error: {msg}")
+                                    logger.error("WebSocket error: %s", msg)
                                     break
                                 elif msg.type == aiohttp.WSMsgType.CLOSED:
-                                    print("WebSocket closed")
+                                    logger.warning("WebSocket closed")
                                     break
-                            except json.JSONDecodeError as e:
-                                print(f"Failed to decode JSON: {e}")
+                            except orjson.JSONDecodeError as e:
+                                logger.warning("Failed to decode JSON: %s", e)
                                 continue
                             except Exception as e:
-                                print(f"Error processing message: {e}")
+                                logger.error("Error processing message: %s", e)
                                 continue
 
                 finally:
@@ -136,10 +215,8 @@ class DiscordSimpleListener:
                         except asyncio.CancelledError:
                             pass
 
-                    await session.close()
-
                     if self.running:
-                        print("Reconnecting in 5 seconds...")
+                        logger.info("Reconnecting in 5 seconds...")
                         await asyncio.sleep(5)
 
             except Exception as e:
@@ -147,12 +224,12 @@ class DiscordSimpleListener:
                 wait_time = min(5 * reconnect_attempts, 60)
 
                 if self.running and reconnect_attempts <= max_reconnect_attempts:
-                    print(f"Connection error (attempt {reconnect_attempts}/{max_reconnect_attempts}): {e}")
-                    print(f"Reconnecting in {wait_time} seconds...")
+                    logger.warning("Connection error (attempt %d/%d): %s", reconnect_attempts, max_reconnect_attempts, e)
+                    logger.info("Reconnecting in %d seconds...", wait_time)
                     await asyncio.sleep(wait_time)
                 else:
                     if self.running:
-                        print(f"Failed to reconnect after {max_reconnect_attempts} attempts")
+                        logger.error("Failed to reconnect after %d attempts", max_reconnect_attempts)
                     break
 
     async def stop(self):
@@ -160,7 +237,7 @@ class DiscordSimpleListener:
         self.running = False
         if self.ws and not self.ws.closed:
             await self.ws.close()
-        if self.http_session:
+        if self.http_session and not self.http_session.closed:
             await self.http_session.close()
 
     async def _identify(self):
@@ -177,7 +254,47 @@ class DiscordSimpleListener:
                 }
             }
         }
-        await self.ws.send_json(payload)
+        await self.ws.send_str(orjson.dumps(payload).decode())
+
+    def _should_skip_frame(self, raw: str) -> bool:
+        """
+        Cheap substring check on the raw frame before JSON parsing.
+
+        Message events for channels or authors we don't monitor are dropped
+        without building the payload dict. Non-message frames always pass, and
+        so does any frame not in compact form - a needle only rules a frame out
+        when the field it checks is present and doesn't match.
+        """
+        is_update = '"t":"MESSAGE_UPDATE"' in raw
+        if not is_update and '"t":"MESSAGE_CREATE"' not in raw:
+            return False
+
+        # Embed/reaction-only edits arrive without a content field
+        if is_update and '"content"' not in raw:
+            return True
+
+        if '"channel_id":"' in raw and not any(needle in raw for needle in self._channel_id_needles):
+            return True
+
+        if (self._user_needles and '"username":"' in raw
+                and not any(needle in raw for needle in self._user_needles)):
+            return True
+
+        return False
+
+    @staticmethod
+    def _frame_sequence(raw: str) -> Optional[int]:
+        """
+        Dispatch sequence number ("s") of a raw frame, without a full parse.
+
+        Discord sends the envelope keys before "d", so an "s" ahead of "d" is
+        the top-level one. Any other layout falls back to parsing the frame.
+        """
+        d_at = raw.find('"d"')
+        match = _SEQ_RE.search(raw, 0, d_at if d_at >= 0 else len(raw))
+        if match:
+            return int(match.group(1))
+        return orjson.loads(raw).get('s')
 
     async def _handle_gateway_event(self, data: dict):
         """Handle incoming gateway events."""
@@ -192,7 +309,7 @@ class DiscordSimpleListener:
         # HELLO (start heartbeat)
         elif op == 10:
             self.heartbeat_interval = event_data.get('heartbeat_interval')
-            print(f"Heartbeat interval: {self.heartbeat_interval}ms")
+            logger.info("Heartbeat interval: %sms", self.heartbeat_interval)
 
             # Cancel old heartbeat task
             if self.heartbeat_task and not self.heartbeat_task.done():
@@ -205,13 +322,21 @@ class DiscordSimpleListener:
             # Start new heartbeat
             self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
+        # HEARTBEAT_ACK (measure gateway round-trip)
+        elif op == 11:
+            if self._last_heartbeat_sent is not None:
+                self._latency = asyncio.get_running_loop().time() - self._last_heartbeat_sent
+                self._last_heartbeat_sent = None
+                if self._latency > self.LATENCY_WARN_SECONDS:
+                    logger.warning("Gateway latency high: %.0fms", self._latency * 1000)
+
         # DISPATCH events
         elif op == 0:
             self.sequence = data.get('s', self.sequence)
 
             if event_type == 'READY':
                 self.session_id = event_data.get('session_id')
-                print(f"Discord READY - session: {self.session_id}")
+                logger.info("Discord READY - session: %s", self.session_id)
 
             elif event_type == 'MESSAGE_CREATE':
                 await self._handle_message(event_data)
@@ -223,56 +348,52 @@ class DiscordSimpleListener:
     async def _handle_message(self, message: dict):
         """Handle MESSAGE_CREATE and MESSAGE_UPDATE events."""
         try:
-            channel_id = int(message.get('channel_id', 0))
-
-            # Check if in monitored channels
-            if channel_id not in self.channel_ids:
+            # Check if in monitored channels (compare snowflake strings, no int parse)
+            if message.get('channel_id') not in self.channel_id_strs:
                 return
 
-            # Get message details
-            author = message.get('author', {})
-            author_name = author.get('username', 'Unknown')
-            content = message.get('content', '').strip()
-            message_id = message.get('id', '')
-            timestamp_str = message.get('timestamp', '')
-
-            # Skip bot messages
+            # Author filters first - most messages stop here
+            author = message.get('author') or _EMPTY
             if author.get('bot', False):
                 return
 
-            # Check if monitored user
-            if self.monitored_users:
-                if author_name not in self.monitored_users:
-                    return
+            author_name = author.get('username', 'Unknown')
+            if self.monitored_users and author_name not in self.monitored_users:
+                return
 
             # Skip empty content
+            content = message.get('content')
+            if content:
+                content = content.strip()
             if not content:
-                print(f"[DEBUG] Empty message from {author_name} - skipping")
+                logger.debug("Empty message from %s - skipping", author_name)
                 return
 
-            # Parse timestamp
+            message_id = message.get('id', '')
+            timestamp_str = message.get('timestamp', '')
+
+            # Parse timestamp (3.11+ fromisoformat handles the trailing 'Z')
             try:
-                timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            except:
+                timestamp = datetime.fromisoformat(timestamp_str)
+            except (TypeError, ValueError):
                 timestamp = datetime.now(timezone.utc)
 
             # Log message
-            print(f"[{timestamp.strftime('%H:%M:%S')}] {author_name}: {content}")
+            logger.info("[%s] %s: %s", timestamp.strftime('%H:%M:%S'), author_name, content)
 
-            # Call callback
+            # Hand off to callback without blocking the gateway reader
             if self.message_callback:
-                try:
-                    await self.message_callback(
-                        message=content,
-                        author=author_name,
-                        message_id=message_id,
-                        timestamp=timestamp,
-                    )
-                except Exception as e:
-                    print(f"Error in message callback: {e}")
+                task = asyncio.create_task(self._run_callback(
+                    message=content,
+                    author=author_name,
+                    message_id=message_id,
+                    timestamp=timestamp,
+                ))
+                self._callback_tasks.add(task)
+                task.add_done_callback(self._callback_tasks.discard)
 
         except Exception as e:
-            print(f"Error handling Discord message: {e}")
+            logger.error("Error handling Discord message: %s", e)
 
     async def _send_heartbeat(self):
         """Send heartbeat to keep connection alive."""
@@ -283,20 +404,38 @@ class DiscordSimpleListener:
             "op": 1,  # HEARTBEAT
             "d": self.sequence
         }
-        await self.ws.send_json(payload)
+        self._last_heartbeat_sent = asyncio.get_running_loop().time()
+        await self.ws.send_str(orjson.dumps(payload).decode())
 
     async def _heartbeat_loop(self):
         """Send periodic heartbeats."""
+        if not self.heartbeat_interval:
+            return
+
+        # Absolute deadlines keep the heartbeat phase fixed, so send latency
+        # doesn't accumulate as drift between beats
+        loop = asyncio.get_running_loop()
+        interval = self.heartbeat_interval / 1000
+        deadline = loop.time() + interval
+
         try:
             while True:
-                if self.heartbeat_interval:
-                    await asyncio.sleep(self.heartbeat_interval / 1000)
-                    try:
-                        await self._send_heartbeat()
-                    except (ConnectionError, ConnectionResetError, OSError) as e:
-                        print(f"Heartbeat stopped: {e}")
-                        break
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
+                deadline += interval
+                try:
+                    await self._send_heartbeat()
+                except (ConnectionError, ConnectionResetError, OSError) as e:
+                    logger.warning("Heartbeat stopped: %s", e)
+                    break
         except asyncio.CancelledError:
             pass  # Normal cancellation
         except Exception as e:
-            print(f"Heartbeat error: {e}")
+            logger.error("Heartbeat error: %s", e)
+
+    async def _run_callback(self, **kwargs):
+        """Run message callback; the lock keeps messages in arrival order."""
+        async with self._callback_lock:
+            try:
+                await self.message_callback(**kwargs)
+            except Exception as e:
+                logger.error("Error in message callback: %s", e)
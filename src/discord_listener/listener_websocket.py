@@ -1,10 +1,16 @@
 import asyncio
-import json
+import logging
 import zlib
 from typing import Callable, Optional
 import aiohttp
+import orjson
 from datetime import datetime, timezone
 
+logger = logging.getLogger(__name__)
+
+# zlib-stream frames are complete once they end with a Z_SYNC_FLUSH marker
+ZLIB_SUFFIX = b'\x00\x00\xff\xff'
+
 
 class DiscordWebSocketListener:
     """
@@ -23,6 +29,7 @@ class DiscordWebSocketListener:
     ):
         self.token = token
         self.channel_ids = set(channel_ids)
+        self.channel_id_strs = frozenset(str(cid) for cid in self.channel_ids)  # Wire format (snowflake strings)
         self.monitored_users = set(monitored_users) if monitored_users else None
         self.message_callback = message_callback
 
@@ -33,8 +40,13 @@ class DiscordWebSocketListener:
         self.session_id = None
         self.running = False
 
-        # For zlib decompression
+        # Callback dispatch (tasks held so they aren't garbage collected)
+        self._callback_lock = asyncio.Lock()
+        self._callback_tasks: set[asyncio.Task] = set()
+
+        # For zlib decompression (one stream per connection)
         self.inflator = zlib.decompressobj()
+        self._buffer = bytearray()
 
     async def start(self):
         """Start the WebSocket connection with auto-reconnect."""
@@ -51,7 +63,11 @@ class DiscordWebSocketListener:
 
                 async with self.session.ws_connect(gateway_url) as ws:
                     self.ws = ws
-                    print("Connected to Discord Gateway")
+
+                    # Fresh zlib context for the new stream
+                    self.inflator = zlib.decompressobj()
+                    self._buffer.clear()
+                    logger.info("Connected to Discord Gateway")
 
                     # Reset reconnect delay on successful connection
                     reconnect_delay = 5
@@ -61,8 +77,8 @@ class DiscordWebSocketListener:
 
             except Exception as e:
                 if self.running:
-                    print(f"Discord WebSocket error: {e}")
-                    print(f"Reconnecting in {reconnect_delay} seconds...")
+                    logger.error("Discord WebSocket error: %s", e)
+                    logger.info("Reconnecting in %d seconds...", reconnect_delay)
                     await asyncio.sleep(reconnect_delay)
 
                     # Exponential backoff
@@ -87,17 +103,22 @@ class DiscordWebSocketListener:
         """Handle incoming WebSocket messages."""
         async for msg in self.ws:
             if msg.type == aiohttp.WSMsgType.BINARY:
-                # Decompress message
-                payload = self._decompress(msg.data)
+                # Buffer fragments until the zlib flush suffix arrives
+                self._buffer.extend(msg.data)
+                if not self._buffer.endswith(ZLIB_SUFFIX):
+                    continue
+
+                payload = self._decompress(self._buffer)
+                self._buffer.clear()
                 await self._handle_payload(payload)
             elif msg.type == aiohttp.WSMsgType.ERROR:
-                print(f"WebSocket error: {msg}")
+                logger.error("WebSocket error: %s", msg)
                 break
 
-    def _decompress(self, data: bytes) -> dict:
-        """Decompress zlib compressed data."""
-        buffer = self.inflator.decompress(data)
-        return json.loads(buffer.decode('utf-8'))
+    def _decompress(self, data: bytearray) -> dict:
+        """Decompress a complete zlib-stream message."""
+        # orjson parses UTF-8 bytes directly - no intermediate str
+        return orjson.loads(self.inflator.decompress(data))
 
     async def _handle_payload(self, payload: dict):
         """Handle a Discord gateway payload."""
@@ -118,10 +139,10 @@ class DiscordWebSocketListener:
         elif op == 1:  # Heartbeat request
             await self._send_heartbeat()
         elif op == 7:  # Reconnect
-            print("Discord requested reconnect")
+            logger.warning("Discord requested reconnect")
             # Should reconnect
         elif op == 9:  # Invalid session
-            print("Invalid session, reconnecting...")
+            logger.warning("Invalid session, reconnecting...")
             await asyncio.sleep(5)
             await self._identify()
         elif op == 11:  # Heartbeat ACK
@@ -151,16 +172,22 @@ class DiscordWebSocketListener:
                 "intents": 513  # GUILDS + GUILD_MESSAGES
             }
         }
-        await self.ws.send_json(payload)
+        await self.ws.send_str(orjson.dumps(payload).decode())
 
     async def _heartbeat_loop(self):
         """Send periodic heartbeats."""
+        # Absolute deadlines: send latency doesn't drift the heartbeat phase
+        loop = asyncio.get_running_loop()
+        interval = self.heartbeat_interval
+        deadline = loop.time() + interval
+
         while self.running:
-            await asyncio.sleep(self.heartbeat_interval)
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+            deadline += interval
             try:
                 await self._send_heartbeat()
             except Exception as e:
-                print(f"Heartbeat error: {e}")
+                logger.error("Heartbeat error: %s", e)
                 # Connection lost, will be handled by main loop
                 break
 
@@ -172,9 +199,9 @@ class DiscordWebSocketListener:
                     "op": 1,
                     "d": self.sequence
                 }
-                await self.ws.send_json(payload)
+                await self.ws.send_str(orjson.dumps(payload).decode())
             except Exception as e:
-                print(f"Failed to send heartbeat: {e}")
+                logger.error("Failed to send heartbeat: %s", e)
                 raise  # Re-raise to be caught by heartbeat_loop
 
     async def _handle_dispatch(self, event_type: str, data: dict):
@@ -183,12 +210,12 @@ class DiscordWebSocketListener:
             self.session_id = data.get('session_id')
             user = data.get('user', {})
             username = user.get('username', 'Unknown')
-            print(f"Discord client logged in as {username}")
-            print(f"Monitoring {len(self.channel_ids)} channel(s)")
+            logger.info("Discord client logged in as %s", username)
+            logger.info("Monitoring %d channel(s)", len(self.channel_ids))
             if self.monitored_users:
-                print(f"Monitoring users: {self.monitored_users}")
+                logger.info("Monitoring users: %s", self.monitored_users)
             else:
-                print("Monitoring all users")
+                logger.info("Monitoring all users")
 
         elif event_type == "MESSAGE_CREATE":
             await self._handle_message(data)
@@ -200,14 +227,14 @@ class DiscordWebSocketListener:
     async def _handle_message(self, data: dict):
         """Handle MESSAGE_CREATE event."""
         # Get message details
-        channel_id = int(data.get('channel_id', 0))
+        channel_id = data.get('channel_id')
         author = data.get('author', {})
         content = data.get('content', '')
         message_id = data.get('id', '')
         timestamp_str = data.get('timestamp', '')
 
-        # Check if in monitored channel
-        if channel_id not in self.channel_ids:
+        # Check if in monitored channel (compare snowflake strings, no int parse)
+        if channel_id not in self.channel_id_strs:
             return
 
         # Get author info
@@ -228,26 +255,33 @@ class DiscordWebSocketListener:
 
         # Skip empty content
         if not content:
-            print(f"[DEBUG] Empty message from {author_name} - skipping")
+            logger.debug("Empty message from %s - skipping", author_name)
             return
 
-        # Parse timestamp
+        # Parse timestamp (3.11+ fromisoformat handles the trailing 'Z')
         try:
-            timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        except:
+            timestamp = datetime.fromisoformat(timestamp_str)
+        except (TypeError, ValueError):
             timestamp = datetime.now(timezone.utc)
 
         # Log message
-        print(f"[{timestamp}] {author_name}: {content}")
+        logger.info("[%s] %s: %s", timestamp, author_name, content)
 
-        # Call callback
+        # Hand off to callback without blocking the gateway reader
         if self.message_callback:
+            task = asyncio.create_task(self._run_callback(
+                message=content,
+                author=author_name,
+                message_id=message_id,
+                timestamp=timestamp,
+            ))
+            self._callback_tasks.add(task)
+            task.add_done_callback(self._callback_tasks.discard)
+
+    async def _run_callback(self, **kwargs):
+        """Run message callback; the lock keeps messages in arrival order."""
+        async with self._callback_lock:
             try:
-                await self.message_callback(
-                    message=content,
-                    author=author_name,
-                    message_id=message_id,
-                    timestamp=timestamp,
-                )
+                await self.message_callback(**kwargs)
             except Exception as e:
-                print(f"Error in message callback: {e}")
+                logger.error("Error in message callback: %s", e)
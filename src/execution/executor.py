@@ -1,12 +1,60 @@
 import asyncio
-from datetime import datetime, timezone
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel
-from ib_insync import IB, Option, LimitOrder, Order, Trade
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional
+import numpy as np
+from ib_insync import IB, Contract, Option, LimitOrder, MarketOrder, Order, Stock, StopOrder, Trade
 
 from ..models import Event, TradeSession, EventType, Direction, SessionState
 
+logger = logging.getLogger(__name__)
+
+# Option right per trade direction
+_RIGHT_MAP = {Direction.CALL: "C", Direction.PUT: "P"}
+
+# IBKR order statuses meaning an order will never fill
+_PREFILL_CANCEL_STATES = frozenset({"Cancelled", "ApiCancelled", "Inactive"})
+_TERMINAL_CANCEL_STATES = _PREFILL_CANCEL_STATES | {"PendingCancel"}
+_FINAL_STATES = _TERMINAL_CANCEL_STATES | {"Filled"}
+# Statuses meaning IBKR has accepted (or already filled) an order
+_ACCEPTED_STATES = frozenset({"PreSubmitted", "Submitted", "Filled"})
+
+# Row formats for display_account_status
+_POS_FMT = "  • {symbol}: {qty} contracts @ avg ${cost:.2f}".format
+_ORD_FMT = "  • {action} {qty} {symbol} @ ${px:.2f} - {status}".format
+
+
+@lru_cache(maxsize=64)
+def _expiry_ibkr(expiry: Optional[str]) -> str:
+    """Convert ISO expiry (2025-12-12) to IBKR format (20251212)."""
+    return expiry.replace('-', '') if expiry else ''
+
+
+# Python 3.12+ only; None on older interpreters
+_EAGER_TASK_FACTORY = getattr(asyncio, "eager_task_factory", None)
+
+
+def _start_task(coro) -> asyncio.Task:
+    """
+    Schedule a coroutine, running it inline up to its first await where eager
+    tasks exist (3.12+). Used only for bracket fill handlers, so their cancel
+    requests go out within the IBKR callback; elsewhere plain create_task.
+    """
+    if _EAGER_TASK_FACTORY is None:
+        return asyncio.create_task(coro)
+    return _EAGER_TASK_FACTORY(asyncio.get_running_loop(), coro)
+
+
+def _price(value: Optional[float]) -> Optional[float]:
+    """Ticker field as a usable price, or None if unset/NaN."""
+    return value if value and not math.isnan(value) else None
+
 
 class OrderStatus(str, Enum):
     """Order execution status."""
@@ -18,17 +66,20 @@ class OrderStatus(str, Enum):
     REJECTED = "REJECTED"
 
 
-class OrderResult(BaseModel):
+@dataclass(slots=True)
+class OrderResult:
     """Result of order execution attempt."""
 
     success: bool
-    order_id: Optional[int] = None
     status: OrderStatus
+    order_id: Optional[int] = None
     filled_price: Optional[float] = None
     message: Optional[str] = None
 
-    class Config:
-        use_enum_values = True
+    def __post_init__(self):
+        # Store the plain status string (consumers compare against "FILLED" etc.)
+        if isinstance(self.status, OrderStatus):
+            self.status = self.status.value
 
 
 class ExecutionEngine:
@@ -42,6 +93,34 @@ class ExecutionEngine:
     - Kill switch enforced
     """
 
+    # Event type -> (handler method, whether it takes the risk-gate quantity)
+    _HANDLERS: dict[EventType, tuple[str, bool]] = {
+        EventType.NEW: ("_execute_entry", True),
+        EventType.ADD: ("_execute_add", True),
+        EventType.EXIT: ("_execute_exit", False),
+        EventType.SL: ("_execute_exit", False),
+        EventType.TP: ("_execute_exit", False),
+        EventType.TRIM: ("_execute_trim", False),
+        EventType.MOVE_STOP: ("_execute_move_stop", False),
+    }
+
+    # Reconnect delay per attempt (seconds); the last entry repeats
+    _BACKOFF = (1, 2, 4, 8, 16, 32, 60)
+
+    # Executed-event results remembered for idempotency (redeliveries are recent)
+    _SUBMITTED_MAX = 1000
+
+    # Qualified contracts kept before the least recently used is evicted
+    _QUALIFIED_MAX = 256
+
+    # How long a fetched account balance is reused (seconds)
+    _BALANCE_TTL = 10.0
+
+    # Pending bracket fill notifications kept before the oldest are dropped
+    _NOTIFY_QUEUE_SIZE = 1000
+    # How long the notify worker collects fills before sending them (seconds)
+    _NOTIFY_BATCH_WINDOW = 0.25
+
     def __init__(
         self,
         host: str = "127.0.0.1",
@@ -56,6 +135,13 @@ class ExecutionEngine:
         self.port = port
         self.client_id = client_id
         self.use_market_orders = use_market_orders
+        # Order-type specific submit paths, fixed for the engine's lifetime
+        if use_market_orders:
+            self._submit_entry = self._submit_entry_market
+            self._submit_add = self._submit_add_market
+        else:
+            self._submit_entry = self._submit_entry_limit
+            self._submit_add = self._submit_add_limit
         self.config = config or {}
         self.notifier = notifier
         self.ib = IB()
@@ -65,8 +151,63 @@ class ExecutionEngine:
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 999999  # Effectively infinite - let Docker handle restarts
 
-        # Track submitted orders for idempotency
-        self.submitted_orders: dict[str, Trade] = {}
+        # Orchestrator hooks, assigned after construction (None = not wired)
+        self.on_bracket_filled: Optional[Callable[[TradeSession, EventType, OrderResult], Awaitable[None]]] = None
+        self.on_disconnected: Optional[Callable[[], Awaitable[None]]] = None
+        self.on_reconnected: Optional[Callable[[], Awaitable[None]]] = None
+
+        # Bracket fill notifications, drained by _notify_worker so a slow
+        # Telegram round-trip never holds up fill handling
+        self._notify_queue: asyncio.Queue[tuple[TradeSession, EventType, OrderResult]] = asyncio.Queue(
+            maxsize=self._NOTIFY_QUEUE_SIZE
+        )
+        self._notify_task: Optional[asyncio.Task] = None
+
+        # Bracket order ID -> ("stop" | "target", owning session), for O(1) fill dispatch
+        self.bracket_index: dict[int, tuple[str, TradeSession]] = {}
+        # Bracket order ID -> Trade, so sibling cancels don't rescan ib.trades().
+        # Entries leave on cancel/inactive status, sibling cancel, or own fill.
+        self._bracket_trades: dict[int, Trade] = {}
+
+        # Results of successfully executed events for idempotency,
+        # keyed by "<discord message id>:<event type>", oldest first
+        self.submitted_orders: OrderedDict[str, OrderResult] = OrderedDict()
+
+        # Qualified contracts keyed by (secType, symbol, expiry, strike, right, exchange),
+        # least recently used first; dropped when the trading day rolls over (_qualified_day)
+        self._qualified: OrderedDict[tuple, Contract] = OrderedDict()
+        self._qualified_day = ""
+        # Lookups in progress, so concurrent callers share one round-trip
+        self._qualify_inflight: dict[tuple, asyncio.Future] = {}
+        # Minimum price increment per conId, from the same contract details
+        self._min_ticks: dict[int, float] = {}
+
+        # Option contract per session_id - a session's contract never changes,
+        # so exits/trims/adds reuse it. Cleared with _qualified at day rollover.
+        self._session_contracts: dict[str, Option] = {}
+
+        # Short-lived results of account queries: key -> (monotonic time, value)
+        self._cache: dict[str, tuple[float, Any]] = {}
+        # Fetches in progress per key, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        # Latest account value per tag, kept current by IBKR account updates.
+        # Subscribed once here (the IB object outlives reconnects)
+        self._acct: dict[str, str] = {}
+        # Set once NetLiquidation has been received
+        self._acct_ready = asyncio.Event()
+        self.ib.accountValueEvent += self._on_account_value
+        self._account_display_task: Optional[asyncio.Task] = None
+
+        # Last display_account_status report, reused until account values,
+        # positions or orders change (_status_dirty)
+        self._status_report: Optional[str] = None
+        self._status_dirty = True
+        self.ib.positionEvent += self._mark_status_dirty
+        self.ib.orderStatusEvent += self._mark_status_dirty
+
+        # (ISO date, IBKR expiry string) for 0DTE retries, refreshed when the day rolls
+        self._today_expiry: tuple[str, str] = ("", "")
 
     async def connect(self) -> bool:
         """Connect to IBKR TWS/Gateway."""
@@ -83,73 +224,94 @@ class ExecutionEngine:
             # Register disconnection callback
             self.ib.disconnectedEvent += self._on_disconnected
 
-            print(f"Connected to IBKR at {self.host}:{self.port}")
-            print("Order monitoring active (bracket fills will be detected)")
-            print("Auto-reconnection enabled")
+            logger.info("Connected to IBKR at %s:%s", self.host, self.port)
+            logger.info("Order monitoring active (bracket fills will be detected)")
+            logger.info("Auto-reconnection enabled")
 
             # Configure market data and order strategy
             if self.use_market_orders:
                 # IBKR Paper account or no real-time data: Use delayed data + market orders
                 self.ib.reqMarketDataType(3)  # 3 = delayed data (free)
-                print("📊 Order Strategy: MARKET orders (delayed data)")
-                print("   ⓘ Using delayed/frozen data - no live market prices during order")
+                logger.info("📊 Order Strategy: MARKET orders (delayed data)")
+                logger.info("   ⓘ Using delayed/frozen data - no live market prices during order")
             else:
                 # IBKR Live account with real-time data: Use real-time data + limit orders
                 self.ib.reqMarketDataType(1)  # 1 = real-time (subscription required)
-                print("📊 Order Strategy: LIMIT orders with 5¢ flexibility (real-time data)")
-                print("   ⓘ Requires IBKR market data subscription for live prices")
-                print("   ⓘ If you see 'Market data pending', check:")
-                print("      - Markets are open (9:30 AM - 4:00 PM ET)")
-                print("      - IBKR subscription: US Securities Snapshot or OPRA")
+                logger.info("📊 Order Strategy: LIMIT orders with 5¢ flexibility (real-time data)")
+                logger.info("   ⓘ Requires IBKR market data subscription for live prices")
+                logger.info("   ⓘ If you see 'Market data pending', check:")
+                logger.info("      - Markets are open (9:30 AM - 4:00 PM ET)")
+                logger.info("      - IBKR subscription: US Securities Snapshot or OPRA")
+
+            # Display account balance in the background - positions, orders and
+            # account values were already synced by connectAsync, so connect()
+            # doesn't need to wait for the printout
+            self._account_display_task = asyncio.create_task(self._display_account_balance())
 
-            # Get and display account balance
-            await self._display_account_balance()
+            if self._notify_task is None or self._notify_task.done():
+                self._notify_task = asyncio.create_task(self._notify_worker())
 
             return True
         except Exception as e:
-            print(f"Failed to connect to IBKR: {e}")
+            logger.error("Failed to connect to IBKR: %s", e)
             self.connected = False
             return False
 
+    def _on_account_value(self, value) -> None:
+        """Callback for each IBKR account value update."""
+        self._acct[value.tag] = value.value
+        self._status_dirty = True
+        if value.tag == 'NetLiquidation':
+            self._acct_ready.set()
+
+    def _mark_status_dirty(self, *_args) -> None:
+        """Callback for position/order changes - the cached status report is stale."""
+        self._status_dirty = True
+
     def _on_disconnected(self):
         """Callback when IBKR connection is lost."""
         self.connected = False
-        print("⚠️ IBKR connection lost! Auto-reconnection will attempt...")
+        logger.warning("⚠️ IBKR connection lost! Auto-reconnection will attempt...")
+
+        # Account values resync on reconnect - make balance readers wait for them
+        self._acct_ready.clear()
+        self._cache.pop("balance", None)
+        self._status_dirty = True
 
         # Notify via callback if available
-        if hasattr(self, 'on_disconnected'):
+        if self.on_disconnected is not None:
             asyncio.create_task(self.on_disconnected())
 
     async def reconnect(self) -> bool:
         """Attempt to reconnect to IBKR."""
         if self.reconnect_attempts >= self.max_reconnect_attempts:
-            print(f"❌ Max reconnection attempts ({self.max_reconnect_attempts}) reached. Manual intervention required.")
+            logger.error("❌ Max reconnection attempts (%s) reached. Manual intervention required.", self.max_reconnect_attempts)
             return False
 
         self.reconnect_attempts += 1
-        print(f"🔄 Reconnection attempt {self.reconnect_attempts}/{self.max_reconnect_attempts}...")
+        logger.info("🔄 Reconnection attempt %s/%s...", self.reconnect_attempts, self.max_reconnect_attempts)
 
         # Wait before attempting (exponential backoff, max 60s)
-        wait_time = min(2 ** min(self.reconnect_attempts, 6), 60)  # Cap at 2^6 = 64s
+        wait_time = self._BACKOFF[min(self.reconnect_attempts, len(self._BACKOFF)) - 1]
         await asyncio.sleep(wait_time)
 
         try:
             success = await self.connect()
             if success:
-                print(f"✓ Reconnected to IBKR successfully!")
+                logger.info("✓ Reconnected to IBKR successfully!")
 
                 # CRITICAL: Rebuild internal state after reconnection
                 await self._rebuild_state_after_reconnect()
 
                 # Notify via callback if available
-                if hasattr(self, 'on_reconnected'):
+                if self.on_reconnected is not None:
                     await self.on_reconnected()
 
                 return True
             else:
                 return False
         except Exception as e:
-            print(f"Reconnection attempt failed: {e}")
+            logger.error("Reconnection attempt failed: %s", e)
             return False
 
     async def _rebuild_state_after_reconnect(self):
@@ -165,68 +327,68 @@ class ExecutionEngine:
         4. Reconcile sessions with actual positions
         5. Re-subscribe to any market data feeds
         """
-        print("🔧 Rebuilding internal state after reconnection...")
+        logger.info("🔧 Rebuilding internal state after reconnection...")
 
         try:
             # Wait for IBKR to populate data
-            await asyncio.sleep(2)
+            await self._wait_for_account_data()
 
             # 1. Re-request account balance
             try:
-                balance = await self.get_account_balance()
+                balance = await self.get_account_balance(force=True)
                 if balance:
-                    print(f"  ✓ Account balance: ${balance:,.2f}")
+                    logger.info(f"  ✓ Account balance: ${balance:,.2f}")
                 else:
-                    print(f"  ⚠️ Could not retrieve account balance")
+                    logger.warning("  ⚠️ Could not retrieve account balance")
             except Exception as e:
-                print(f"  ⚠️ Error fetching account balance: {e}")
+                logger.error("  ⚠️ Error fetching account balance: %s", e)
 
             # 2. Re-request positions
             try:
                 positions = await self.get_positions()
-                print(f"  ✓ Found {len(positions)} position(s)")
+                logger.info("  ✓ Found %s position(s)", len(positions))
 
                 # Log positions for debugging
                 for pos in positions:
                     contract = pos.contract
-                    symbol = contract.localSymbol if hasattr(contract, 'localSymbol') else contract.symbol
-                    print(f"    - {symbol}: {pos.position} @ ${pos.avgCost:.2f}")
+                    symbol = getattr(contract, 'localSymbol', None) or contract.symbol
+                    logger.info("    - %s: %s @ $%.2f", symbol, pos.position, pos.avgCost)
             except Exception as e:
-                print(f"  ⚠️ Error fetching positions: {e}")
+                logger.error("  ⚠️ Error fetching positions: %s", e)
 
             # 3. Re-request open orders
             try:
                 open_orders = await self.get_open_orders()
-                print(f"  ✓ Found {len(open_orders)} open order(s)")
+                logger.info("  ✓ Found %s open order(s)", len(open_orders))
 
                 # Re-register order callbacks (orderStatusEvent may have been lost)
                 # IBKR auto-resubscribes to order updates, but we ensure callbacks are active
                 if open_orders:
-                    print(f"    Re-registering {len(open_orders)} order status callbacks...")
+                    logger.info("    Re-registering %s order status callbacks...", len(open_orders))
             except Exception as e:
-                print(f"  ⚠️ Error fetching open orders: {e}")
+                logger.error("  ⚠️ Error fetching open orders: %s", e)
 
             # 4. Reconcile sessions with positions (if session_manager available)
             if self.session_manager:
                 try:
                     open_sessions = [s for s in self.session_manager.sessions.values()
                                    if s.state == SessionState.OPEN]
-                    print(f"  ✓ Found {len(open_sessions)} open session(s)")
+                    logger.info("  ✓ Found %s open session(s)", len(open_sessions))
 
                     # Trigger reconciliation (will be handled by orchestrator's reconciliation task)
                 except Exception as e:
-                    print(f"  ⚠️ Error reconciling sessions: {e}")
+                    logger.error("  ⚠️ Error reconciling sessions: %s", e)
 
-            print("✓ State rebuild complete")
+            logger.info("✓ State rebuild complete")
 
         except Exception as e:
-            print(f"⚠️ Error during state rebuild: {e}")
+            logger.error("⚠️ Error during state rebuild: %s", e)
             # Don't fail reconnection if state rebuild fails - we're still connected
 
     async def ensure_connected(self) -> bool:
         """Ensure connection is active, reconnect if necessary."""
         if not self.connected:
-            print("⚠️ Not connected to IBKR. Attempting to reconnect...")
+            logger.warning("⚠️ Not connected to IBKR. Attempting to reconnect...")
             return await self.reconnect()
         return True
 
@@ -235,7 +397,7 @@ class ExecutionEngine:
         if self.connected:
             self.ib.disconnect()
             self.connected = False
-            print("Disconnected from IBKR")
+            logger.info("Disconnected from IBKR")
 
     def activate_kill_switch(self, reason: str) -> None:
         """
@@ -247,12 +409,12 @@ class ExecutionEngine:
         - Manual intervention
         """
         self.kill_switch_active = True
-        print(f"KILL SWITCH ACTIVATED: {reason}")
+        logger.info("KILL SWITCH ACTIVATED: %s", reason)
 
     def deactivate_kill_switch(self) -> None:
         """Deactivate kill switch (use with caution)."""
         self.kill_switch_active = False
-        print("Kill switch deactivated")
+        logger.info("Kill switch deactivated")
 
     def _on_order_status_change(self, trade):
         """
@@ -264,51 +426,76 @@ class ExecutionEngine:
         Note: Brackets are standalone orders (not parent-child), so we check
         order IDs against session.stop_order_id and session.target_order_ids.
         """
-        order_id = trade.order.orderId
+        # Only care about filled orders - rejects most events before any other lookup
         status = trade.orderStatus.status
-
-        # Only care about filled orders
         if status != "Filled":
+            if status in _PREFILL_CANCEL_STATES:
+                self._bracket_trades.pop(trade.order.orderId, None)
             return
-
-        # Find session by order ID (checks if this order is a bracket)
-        if not self.session_manager:
+        if self.session_manager is None:
             return
 
-        session = self._find_session_by_order_id(order_id)
+        order_id = trade.order.orderId
 
-        if not session:
-            # Not a bracket order we're tracking
+        # Every bracket is registered through _set_brackets, so a miss means
+        # this isn't a bracket order we're tracking (entries, exits, closed sessions)
+        entry = self.bracket_index.get(order_id)
+        if entry is None:
             return
 
+        kind, session = entry
+
         # Ensure session is still open
-        from ..models import SessionState
         if session.state != SessionState.OPEN:
             return
 
-        # Determine if this is stop or target
-        if order_id == session.stop_order_id:
+        # Dispatch on bracket kind. The session is closed right here,
+        # synchronously, so repeated "Filled" ticks for the same order see it
+        # closed; only the cancel/notify tail runs as a task
+        if kind == "stop":
             # Stop loss filled
-            print(f"🔔 Bracket order filled: STOP LOSS (Order #{order_id})")
-            asyncio.create_task(self._handle_stop_filled(session, trade))
-        elif order_id in session.target_order_ids:
+            logger.info("🔔 Bracket order filled: STOP LOSS (Order #%s)", order_id)
+            fill_price, pnl = self._close_session_on_bracket_fill(session, trade, "STOP_HIT")
+            _start_task(self._handle_stop_filled(session, trade, fill_price, pnl))
+        else:
             # Take profit filled
-            print(f"🔔 Bracket order filled: TAKE PROFIT (Order #{order_id})")
-            asyncio.create_task(self._handle_target_filled(session, trade))
+            logger.info("🔔 Bracket order filled: TAKE PROFIT (Order #%s)", order_id)
+            fill_price, pnl = self._close_session_on_bracket_fill(session, trade, "TARGET_HIT")
+            _start_task(self._handle_target_filled(session, trade, fill_price, pnl))
 
-    def _find_session_by_order_id(self, order_id: int):
-        """Find session by stop or target order ID."""
+    def _index_brackets(self, session: TradeSession) -> None:
+        """Register the session's current stop/target order IDs in bracket_index."""
+        if session.stop_order_id:
+            self.bracket_index[session.stop_order_id] = ("stop", session)
+        for order_id in session.target_order_ids:
+            self.bracket_index[order_id] = ("target", session)
 
-        if not self.session_manager:
-            return None
+    def _unindex_brackets(self, session: TradeSession) -> None:
+        """Remove the session's current stop/target order IDs from bracket_index."""
+        self.bracket_index.pop(session.stop_order_id, None)
+        for order_id in session.target_order_ids:
+            self.bracket_index.pop(order_id, None)
 
-        for session in self.session_manager.sessions.values():
-            if session.stop_order_id == order_id:
-                return session
-            if order_id in session.target_order_ids:
-                return session
+    def release_session_brackets(self, session: TradeSession) -> None:
+        """
+        Forget a closed session's brackets (already cancelled) in both indexes.
 
-        return None
+        Every path that closes a session must call this, including the
+        orchestrator's own closes, or bracket_index/_bracket_trades grow unbounded.
+        """
+        self._unindex_brackets(session)
+        self._bracket_trades.pop(session.stop_order_id, None)
+        for order_id in session.target_order_ids:
+            self._bracket_trades.pop(order_id, None)
+
+    def _set_brackets(
+        self, session: TradeSession, stop_order_id: Optional[int], target_order_ids: list[int]
+    ) -> None:
+        """Assign new bracket order IDs to a session, keeping bracket_index in sync."""
+        self._unindex_brackets(session)
+        session.stop_order_id = stop_order_id
+        session.target_order_ids = target_order_ids
+        self._index_brackets(session)
 
     def _calculate_session_pnl(
         self,
@@ -328,33 +515,48 @@ class ExecutionEngine:
 
         price_diff = exit_price - session.avg_entry_price
         contract_multiplier = 100
-        pnl = price_diff * session.total_quantity * contract_multiplier
 
-        return round(pnl, 2)
+        # Round to whole cents as an int, then scale back once. avg_entry_price
+        # can be a fractional-cent average after ADDs, so round the total, not
+        # the per-contract difference.
+        pnl_cents = round(price_diff * session.total_quantity * contract_multiplier * 100)
+        return pnl_cents / 100
 
-    async def _handle_stop_filled(self, session, trade):
-        """Handle stop loss bracket order fill."""
+    def _close_session_on_bracket_fill(self, session, trade, exit_reason: str) -> tuple[float, float]:
+        """
+        Mark a session closed from a bracket fill.
 
+        Returns:
+            (fill_price, realized P&L)
+        """
         fill_price = trade.orderStatus.avgFillPrice
         pnl = self._calculate_session_pnl(session, fill_price)
 
-        # Update session
-        from ..models import SessionState
-        now = datetime.now(timezone.utc)
+        # Stamp with the time IBKR's fill status arrived - the wrapper already
+        # recorded it as a UTC datetime on the trade log entry
+        now = trade.log[-1].time if trade.log else datetime.now(timezone.utc)
         session.state = SessionState.CLOSED
         session.closed_at = now
         session.updated_at = now  # Update timestamp
-        session.exit_reason = "STOP_HIT"
+        session.exit_reason = exit_reason
         session.exit_order_id = trade.order.orderId
         session.exit_price = fill_price
         session.realized_pnl = pnl
 
+        self._unindex_brackets(session)
+        self._bracket_trades.pop(trade.order.orderId, None)
+
+        return fill_price, pnl
+
+    async def _handle_stop_filled(self, session, trade, fill_price: float, pnl: float):
+        """Handle stop loss bracket order fill (session already closed)."""
+
         # Cancel remaining target orders
         await self._cancel_sibling_orders(session.target_order_ids)
 
         # Log to console
-        symbol = f"{session.underlying} {session.strike}{session.direction.value[0] if session.direction else '?'}"
-        print(f"🛑 STOP HIT: {symbol} @ ${fill_price:.2f} | P&L: ${pnl:+,.2f}")
+        symbol = session.display_symbol
+        logger.info("🛑 STOP HIT: %s @ $%.2f | P&L: $%+.2f", symbol, fill_price, pnl)
 
         # Create OrderResult for notification
         result = OrderResult(
@@ -366,34 +568,18 @@ class ExecutionEngine:
         )
 
         # Send Telegram notification (via orchestrator callback)
-        if hasattr(self, 'on_bracket_filled'):
-            from ..models import EventType
-            await self.on_bracket_filled(session, EventType.SL, result)
+        self._queue_notification(session, EventType.SL, result)
 
-    async def _handle_target_filled(self, session, trade):
-        """Handle take profit bracket order fill."""
-
-        fill_price = trade.orderStatus.avgFillPrice
-        pnl = self._calculate_session_pnl(session, fill_price)
-
-        # Update session
-        from ..models import SessionState
-        now = datetime.now(timezone.utc)
-        session.state = SessionState.CLOSED
-        session.closed_at = now
-        session.updated_at = now  # Update timestamp
-        session.exit_reason = "TARGET_HIT"
-        session.exit_order_id = trade.order.orderId
-        session.exit_price = fill_price
-        session.realized_pnl = pnl
+    async def _handle_target_filled(self, session, trade, fill_price: float, pnl: float):
+        """Handle take profit bracket order fill (session already closed)."""
 
         # Cancel stop loss order
         if session.stop_order_id:
             await self._cancel_sibling_orders([session.stop_order_id])
 
         # Log to console
-        symbol = f"{session.underlying} {session.strike}{session.direction.value[0] if session.direction else '?'}"
-        print(f"🎯 TARGET HIT: {symbol} @ ${fill_price:.2f} | P&L: ${pnl:+,.2f}")
+        symbol = session.display_symbol
+        logger.info("🎯 TARGET HIT: %s @ $%.2f | P&L: $%+.2f", symbol, fill_price, pnl)
 
         # Create OrderResult for notification
         result = OrderResult(
@@ -405,9 +591,47 @@ class ExecutionEngine:
         )
 
         # Send Telegram notification (via orchestrator callback)
-        if hasattr(self, 'on_bracket_filled'):
-            from ..models import EventType
-            await self.on_bracket_filled(session, EventType.TP, result)
+        self._queue_notification(session, EventType.TP, result)
+
+    def _queue_notification(self, session: TradeSession, event_type: EventType, result: OrderResult) -> None:
+        """Hand a bracket fill to the notify worker, dropping the oldest if the queue is full."""
+        if self.on_bracket_filled is None:
+            return
+
+        if self._notify_queue.full():
+            dropped_session, dropped_type, _ = self._notify_queue.get_nowait()
+            self._notify_queue.task_done()
+            logger.warning(
+                "Notification queue full - dropped %s for session %s",
+                dropped_type.value, dropped_session.session_id[:8],
+            )
+        self._notify_queue.put_nowait((session, event_type, result))
+
+    async def _notify_worker(self) -> None:
+        """
+        Deliver queued bracket fill notifications in batches.
+
+        After the first fill arrives, waits _NOTIFY_BATCH_WINDOW for others
+        (a market move can stop out several sessions at once) and sends the
+        batch concurrently instead of one round-trip after another.
+        """
+        while True:
+            batch = [await self._notify_queue.get()]
+            await asyncio.sleep(self._NOTIFY_BATCH_WINDOW)
+            while not self._notify_queue.empty():
+                batch.append(self._notify_queue.get_nowait())
+
+            results = await asyncio.gather(
+                *(self.on_bracket_filled(session, event_type, result) for session, event_type, result in batch),
+                return_exceptions=True,
+            )
+            for (session, _, _), outcome in zip(batch, results):
+                if isinstance(outcome, Exception):
+                    logger.error(
+                        "Bracket fill notification failed for session %s",
+                        session.session_id[:8], exc_info=outcome,
+                    )
+                self._notify_queue.task_done()
 
     async def _cancel_sibling_orders(self, order_ids: list[int]):
         """Cancel sibling bracket orders when one fills (OCO behavior)."""
@@ -418,45 +642,48 @@ class ExecutionEngine:
         cancelled_count = 0
         failed_count = 0
 
+        # Brackets placed by this process are tracked in _bracket_trades; only
+        # index ib.trades() (once) for any that aren't
+        trade_by_id: Optional[dict[int, Trade]] = None
+
         for order_id in order_ids:
             try:
-                # Find the trade by order ID
-                trades = self.ib.trades()
-                trade_found = False
-
-                for trade in trades:
-                    if trade.order.orderId == order_id:
-                        trade_found = True
-                        status = trade.orderStatus.status
-
-                        if trade.isActive():
-                            self.ib.cancelOrder(trade.order)
-                            cancelled_count += 1
-                            print(f"  ✓ Cancelled bracket order {order_id}")
-                        else:
-                            # Order not active - may be filling or filled
-                            print(f"  ⚠️ Cannot cancel order {order_id} - Status: {status}")
-                            if status in ["Filled", "PartiallyFilled"]:
-                                print(f"     🚨 CRITICAL: Bracket filled after session closed!")
-                                print(f"     🚨 This may create a SHORT position if entry was already closed!")
-                                failed_count += 1
-                        break
-
-                if not trade_found:
-                    print(f"  ⚠️ Order {order_id} not found in active trades (may have already filled)")
+                trade = self._bracket_trades.pop(order_id, None)
+                if trade is None:
+                    if trade_by_id is None:
+                        trade_by_id = {t.order.orderId: t for t in self.ib.trades()}
+                    trade = trade_by_id.get(order_id)
+
+                if trade is None:
+                    logger.warning("  ⚠️ Order %s not found in active trades (may have already filled)", order_id)
                     failed_count += 1
+                    continue
+
+                status = trade.orderStatus.status
+
+                if trade.isActive():
+                    self.ib.cancelOrder(trade.order)
+                    cancelled_count += 1
+                    logger.info("  ✓ Cancelled bracket order %s", order_id)
+                else:
+                    # Order not active - may be filling or filled
+                    logger.warning("  ⚠️ Cannot cancel order %s - Status: %s", order_id, status)
+                    if status in ["Filled", "PartiallyFilled"]:
+                        logger.error("     🚨 CRITICAL: Bracket filled after session closed!")
+                        logger.error("     🚨 This may create a SHORT position if entry was already closed!")
+                        failed_count += 1
 
             except Exception as e:
-                print(f"  ⚠️ Failed to cancel order {order_id}: {e}")
+                logger.error("  ⚠️ Failed to cancel order %s: %s", order_id, e)
                 failed_count += 1
 
         # Log summary
         total = len(order_ids)
         if cancelled_count > 0:
-            print(f"  Bracket cancellation: {cancelled_count}/{total} cancelled")
+            logger.info("  Bracket cancellation: %d/%d cancelled", cancelled_count, total)
         if failed_count > 0:
-            print(f"  ⚠️ WARNING: {failed_count}/{total} brackets could not be cancelled!")
-            print(f"  ⚠️ Check for orphaned positions in IBKR")
+            logger.warning("  ⚠️ WARNING: %d/%d brackets could not be cancelled!", failed_count, total)
+            logger.warning("  ⚠️ Check for orphaned positions in IBKR")
 
     async def execute_event(
         self,
@@ -492,23 +719,47 @@ class ExecutionEngine:
             )
 
         # Route to appropriate handler
-        if event.event_type == EventType.NEW:
-            return await self._execute_entry(event, session, quantity)
-        elif event.event_type == EventType.ADD:
-            return await self._execute_add(event, session, quantity)
-        elif event.event_type in [EventType.EXIT, EventType.SL, EventType.TP]:
-            return await self._execute_exit(event, session)
-        elif event.event_type == EventType.TRIM:
-            return await self._execute_trim(event, session)
-        elif event.event_type == EventType.MOVE_STOP:
-            return await self._execute_move_stop(event, session)
-        else:
+        handler = self._HANDLERS.get(event.event_type)
+        if handler is None:
             return OrderResult(
                 success=False,
                 status=OrderStatus.REJECTED,
                 message=f"Event type {event.event_type} not executable",
             )
 
+        # Idempotency: an edited or redelivered message must not trade twice.
+        # The orchestrator checks executed_result() before session correlation;
+        # this is the backstop for other callers.
+        key = self._idempotency_key(event)
+        if key is not None:
+            prior = self.submitted_orders.get(key)
+            if prior is not None:
+                logger.info("  ⓘ Event already executed for message %s - skipping", event.message_id)
+                return prior
+
+        method_name, takes_quantity = handler
+        method = getattr(self, method_name)
+        if takes_quantity:
+            result = await method(event, session, quantity)
+        else:
+            result = await method(event, session)
+
+        if key is not None and result.success:
+            self.submitted_orders[key] = result
+            if len(self.submitted_orders) > self._SUBMITTED_MAX:
+                self.submitted_orders.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _idempotency_key(event: Event) -> Optional[str]:
+        """submitted_orders key: "<discord message id>:<event type>" (None without an id)."""
+        return f"{event.message_id}:{event.event_type.value}" if event.message_id else None
+
+    def executed_result(self, event: Event) -> Optional[OrderResult]:
+        """Result of an earlier successful execution of this message/event pair, if any."""
+        key = self._idempotency_key(event)
+        return self.submitted_orders.get(key) if key is not None else None
+
     async def _execute_entry(
         self, event: Event, session: TradeSession, quantity: int
     ) -> OrderResult:
@@ -527,17 +778,17 @@ class ExecutionEngine:
             contract = self._build_contract(event)
 
             # CRITICAL: Qualify contract with IBKR to ensure it exists
-            qualified = await self.ib.qualifyContractsAsync(contract)
+            qualified = await self._qualify(contract)
 
             # If contract not found, try today's expiry (0DTE)
             if not qualified:
-                print(f"  ⚠️  Contract not found for expiry {contract.lastTradeDateOrContractMonth}")
-                print(f"  Trying 0DTE (same-day expiry)...")
+                logger.warning("  ⚠️  Contract not found for expiry %s", contract.lastTradeDateOrContractMonth)
+                logger.info("  Trying 0DTE (same-day expiry)...")
 
-                today = datetime.now().strftime('%Y%m%d')
+                today = self._today_ibkr()
                 contract.lastTradeDateOrContractMonth = today
 
-                qualified = await self.ib.qualifyContractsAsync(contract)
+                qualified = await self._qualify(contract)
 
                 if not qualified:
                     return OrderResult(
@@ -547,13 +798,13 @@ class ExecutionEngine:
                     )
 
             # Use the qualified contract
-            contract = qualified[0]
-            print(f"  ✓ Qualified contract: {contract.localSymbol}")
+            contract = qualified
+            logger.info("  ✓ Qualified contract: %s", contract.localSymbol)
 
             # Convert underlying targets to premium if needed (Issue 5)
             target_price = event.targets[0] if event.targets else None
             if event.target_type == "UNDERLYING" and target_price:
-                print(f"  ⓘ Converting underlying target ${target_price:.2f} to premium estimate...")
+                logger.info("  ⓘ Converting underlying target $%.2f to premium estimate...", target_price)
 
                 # Get current underlying price
                 current_underlying_price = await self._get_underlying_price(event.underlying)
@@ -566,75 +817,16 @@ class ExecutionEngine:
 
                     if premium_target:
                         target_price = premium_target
-                        print(f"  ✓ Using converted premium target: ${target_price:.2f}")
+                        logger.info("  ✓ Using converted premium target: $%.2f", target_price)
                     else:
-                        print(f"  ⚠️ Conversion failed, falling back to auto-calculated target")
+                        logger.warning("  ⚠️ Conversion failed, falling back to auto-calculated target")
                         target_price = None  # Let bracket calculation use R/R ratio
                 else:
-                    print(f"  ⚠️ Could not fetch underlying price, falling back to auto-calculated target")
+                    logger.warning("  ⚠️ Could not fetch underlying price, falling back to auto-calculated target")
                     target_price = None  # Let bracket calculation use R/R ratio
 
             # Step 1: Submit entry order (Market or Limit based on data availability)
-            from ib_insync import MarketOrder, LimitOrder
-
-            if self.use_market_orders:
-                # Use MARKET order (IBKR paper or no real-time data)
-                parent_order = MarketOrder("BUY", quantity)
-                parent_trade = self.ib.placeOrder(contract, parent_order)
-                print(f"  ⓘ MARKET order submitted for {quantity} contracts")
-            else:
-                # Use LIMIT order with 5¢ flexibility (real-time data available)
-                # Get current market data
-                print(f"  Fetching current market data...")
-                ticker = self.ib.reqMktData(contract)
-                await asyncio.sleep(1)  # Wait for real-time data
-
-                # Handle NaN and None values
-                import math
-                market_bid = ticker.bid if ticker.bid and not math.isnan(ticker.bid) else None
-                market_ask = ticker.ask if ticker.ask and not math.isnan(ticker.ask) else None
-                market_last = ticker.last if ticker.last and not math.isnan(ticker.last) else None
-
-                if market_bid and market_ask:
-                    last_str = f"${market_last:.2f}" if market_last else "N/A"
-                    print(f"  📊 Market: Bid ${market_bid:.2f} | Ask ${market_ask:.2f} | Last {last_str}")
-                elif market_last:
-                    print(f"  📊 Market: Last ${market_last:.2f}")
-
-                # Determine entry price with 5-cent flexibility
-                alert_price = event.entry_price or (market_ask if market_ask else market_last)
-
-                if not alert_price:
-                    print(f"  ⚠️ No market data available, falling back to MARKET order")
-                    parent_order = MarketOrder("BUY", quantity)
-                    parent_trade = self.ib.placeOrder(contract, parent_order)
-                    print(f"  ⓘ MARKET order submitted (no market data)")
-                else:
-                    entry_price = alert_price
-                    max_entry_price = alert_price + 0.05  # 5¢ flexibility
-
-                    if market_ask:
-                        if market_ask > entry_price and market_ask <= max_entry_price:
-                            # Market moved up but within tolerance
-                            old_price = entry_price
-                            entry_price = market_ask
-                            print(f"  ⓘ Adjusting entry: ${old_price:.2f} → ${entry_price:.2f} (market moved, within 5¢)")
-                        elif market_ask > max_entry_price:
-                            # Market moved too far, use max allowed
-                            deviation = market_ask - alert_price
-                            print(f"  ⚠️ Market ask ${market_ask:.2f} is ${deviation:.2f} above alert ${alert_price:.2f}")
-                            print(f"  ⚠️ Using max allowed: ${max_entry_price:.2f} (alert + 5¢)")
-                            entry_price = max_entry_price
-                        elif market_ask < entry_price:
-                            # Better entry available
-                            old_price = entry_price
-                            entry_price = market_ask
-                            print(f"  ✓ Better entry: ${old_price:.2f} → ${entry_price:.2f} (below alert)")
-
-                    parent_order = LimitOrder("BUY", quantity, entry_price)
-                    parent_order.tif = "DAY"
-                    parent_trade = self.ib.placeOrder(contract, parent_order)
-                    print(f"  ⓘ LIMIT order submitted @ ${entry_price:.2f}")
+            parent_trade = await self._submit_entry(event, contract, quantity)
 
             # Step 2: Wait for parent fill with real-time Telegram updates
             filled = await self._wait_for_fill(
@@ -650,13 +842,14 @@ class ExecutionEngine:
 
                 # CRITICAL: Close session when entry times out
                 # Prevents stale PENDING sessions blocking future trades
+                now = datetime.now(timezone.utc)
                 session.state = SessionState.CLOSED
-                session.closed_at = datetime.now(timezone.utc)
-                session.updated_at = datetime.now(timezone.utc)
+                session.closed_at = now
+                session.updated_at = now
                 session.exit_reason = "ENTRY_TIMEOUT"
                 session.total_quantity = 0
 
-                print(f"  ✗ Entry timeout - session closed: {session.session_id[:8]}...")
+                logger.warning("  ✗ Entry timeout - session closed: %s...", session.session_id[:8])
 
                 return OrderResult(
                     success=False,
@@ -666,7 +859,7 @@ class ExecutionEngine:
 
             # Step 3: Capture ACTUAL fill price
             actual_fill_price = parent_trade.orderStatus.avgFillPrice
-            print(f"  ✓ Entry filled at ${actual_fill_price:.2f}")
+            logger.info("  ✓ Entry filled at $%.2f", actual_fill_price)
 
             # Step 4: Update session BEFORE creating brackets
             now = datetime.now(timezone.utc)
@@ -677,7 +870,7 @@ class ExecutionEngine:
             session.total_quantity = quantity
             session.avg_entry_price = actual_fill_price
 
-            print(f"  ✓ Session updated: {session.session_id[:8]}... | qty={quantity} @ ${actual_fill_price:.2f}")
+            logger.info("  ✓ Session updated: %s... | qty=%s @ $%.2f", session.session_id[:8], quantity, actual_fill_price)
 
             # Step 5: Calculate bracket prices using ACTUAL fill price
             # CRITICAL: Always use actual fill price, not limit price
@@ -686,6 +879,7 @@ class ExecutionEngine:
                 actual_fill_price,
                 event.stop_loss,
                 target_price,
+                contract,
             )
 
             # Step 6: Create bracket orders using actual fill price
@@ -699,32 +893,29 @@ class ExecutionEngine:
 
             # Step 7: Store bracket order IDs
             if bracket_result:
-                session.stop_order_id = bracket_result.get('stop_order_id')
-                session.target_order_ids = bracket_result.get('target_order_ids', [])
+                self._set_brackets(
+                    session,
+                    bracket_result.get('stop_order_id'),
+                    bracket_result.get('target_order_ids', []),
+                )
             else:
                 # CRITICAL: Bracket creation failed, position is unprotected!
-                print(f"  🚨 CRITICAL: Bracket creation FAILED after entry fill!")
-                print(f"  🚨 Position is UNPROTECTED - initiating emergency exit")
-
-                # Log critical error
-                import traceback
-                traceback.print_exc()
+                logger.error("  🚨 CRITICAL: Bracket creation FAILED after entry fill!")
+                logger.error("  🚨 Position is UNPROTECTED - initiating emergency exit")
 
                 # Attempt emergency market exit
                 try:
-                    from ib_insync import MarketOrder
                     emergency_order = MarketOrder("SELL", quantity)
                     emergency_trade = self.ib.placeOrder(contract, emergency_order)
 
-                    # Wait for emergency exit (short timeout)
-                    await asyncio.sleep(1)
+                    # Wait for emergency exit (short timeout) - returns on the fill status
                     filled = await self._wait_for_fill(emergency_trade, timeout=10)
 
                     if filled:
                         exit_price = emergency_trade.orderStatus.avgFillPrice
                         pnl = (exit_price - actual_fill_price) * quantity * 100
 
-                        print(f"  ✓ Emergency exit filled @ ${exit_price:.2f} | P&L: ${pnl:+,.2f}")
+                        logger.info(f"  ✓ Emergency exit filled @ ${exit_price:.2f} | P&L: ${pnl:+,.2f}")
 
                         # Close session
                         session.state = SessionState.CLOSED
@@ -733,6 +924,7 @@ class ExecutionEngine:
                         session.exit_price = exit_price
                         session.total_quantity = 0
                         session.realized_pnl = pnl
+                        self.release_session_brackets(session)
 
                         return OrderResult(
                             success=False,
@@ -742,7 +934,7 @@ class ExecutionEngine:
                             message=f"CRITICAL: Bracket failure. Emergency exit @ ${exit_price:.2f} | P&L: ${pnl:+,.2f}",
                         )
                     else:
-                        print(f"  🚨 CRITICAL: Emergency exit FAILED - MANUAL INTERVENTION REQUIRED")
+                        logger.error("  🚨 CRITICAL: Emergency exit FAILED - MANUAL INTERVENTION REQUIRED")
                         # Position still open but unprotected - user must manually close
                         session.state = SessionState.OPEN
                         return OrderResult(
@@ -754,8 +946,7 @@ class ExecutionEngine:
                         )
 
                 except Exception as emergency_error:
-                    print(f"  🚨 CRITICAL: Emergency exit exception: {emergency_error}")
-                    traceback.print_exc()
+                    logger.exception("  🚨 CRITICAL: Emergency exit exception: %s", emergency_error)
                     # Position still open but unprotected - user must manually close
                     session.state = SessionState.OPEN
                     return OrderResult(
@@ -770,8 +961,8 @@ class ExecutionEngine:
             # CRITICAL: Use actual_fill_price for percentage calculations
             # (same price used to calculate the brackets)
             if actual_fill_price <= 0:
-                print(f"  ⚠️ WARNING: Invalid fill price {actual_fill_price}, cannot calculate bracket percentages")
-                print(f"  ⚠️ ADD operations will not be able to update brackets")
+                logger.warning("  ⚠️ WARNING: Invalid fill price %s, cannot calculate bracket percentages", actual_fill_price)
+                logger.warning("  ⚠️ ADD operations will not be able to update brackets")
                 session.stop_loss_percent = None
                 session.target_percent = None
             else:
@@ -797,8 +988,7 @@ class ExecutionEngine:
             )
 
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("  ⚠️ Entry execution error: %s", e)
             return OrderResult(
                 success=False,
                 status=OrderStatus.REJECTED,
@@ -826,61 +1016,21 @@ class ExecutionEngine:
                     message=f"Cannot ADD {quantity} contracts - must be positive number",
                 )
 
-            contract = self._build_contract_from_session(session)
+            contract = self._build_contract(session)
 
             # Qualify contract with IBKR
-            qualified = await self.ib.qualifyContractsAsync(contract)
+            qualified = await self._qualify(contract)
             if not qualified:
                 return OrderResult(
                     success=False,
                     status=OrderStatus.REJECTED,
                     message=f"Contract not found: {contract.symbol} {contract.strike}{contract.right}",
                 )
-            contract = qualified[0]
-            print(f"  ✓ Qualified contract: {contract.localSymbol}")
+            contract = qualified
+            logger.info("  ✓ Qualified contract: %s", contract.localSymbol)
 
             # Submit ADD order (Market or Limit based on data availability)
-            from ib_insync import MarketOrder, LimitOrder
-
-            if self.use_market_orders:
-                # Use MARKET order (IBKR paper or no real-time data)
-                order = MarketOrder("BUY", quantity)
-                trade = self.ib.placeOrder(contract, order)
-                print(f"  ⓘ ADD MARKET order submitted: {quantity} contracts")
-            else:
-                # Use LIMIT order with 5¢ flexibility (real-time data available)
-                print(f"  Fetching current market data...")
-                ticker = self.ib.reqMktData(contract)
-                await asyncio.sleep(1)
-
-                import math
-                market_ask = ticker.ask if ticker.ask and not math.isnan(ticker.ask) else None
-                market_last = ticker.last if ticker.last and not math.isnan(ticker.last) else None
-
-                add_price = event.entry_price or market_ask or market_last
-
-                if not add_price:
-                    print(f"  ⚠️ No market data, falling back to MARKET order")
-                    order = MarketOrder("BUY", quantity)
-                    trade = self.ib.placeOrder(contract, order)
-                    print(f"  ⓘ ADD MARKET order submitted (no data)")
-                else:
-                    # Allow 5¢ flexibility
-                    if market_ask and market_ask > add_price:
-                        if market_ask <= add_price + 0.05:
-                            print(f"  ⓘ Adjusting ADD: ${add_price:.2f} → ${market_ask:.2f} (within 5¢)")
-                            add_price = market_ask
-                        else:
-                            print(f"  ⚠️ Using max allowed: ${add_price + 0.05:.2f}")
-                            add_price = add_price + 0.05
-                    elif market_ask and market_ask < add_price:
-                        print(f"  ✓ Better ADD entry: ${add_price:.2f} → ${market_ask:.2f}")
-                        add_price = market_ask
-
-                    order = LimitOrder("BUY", quantity, add_price)
-                    order.tif = "DAY"
-                    trade = self.ib.placeOrder(contract, order)
-                    print(f"  ⓘ ADD LIMIT order submitted @ ${add_price:.2f}")
+            trade = await self._submit_add(event, contract, quantity)
 
             # Wait for fill with real-time Telegram updates
             filled = await self._wait_for_fill(
@@ -909,7 +1059,7 @@ class ExecutionEngine:
 
             # Validate before division
             if new_quantity <= 0:
-                print(f"  🚨 ERROR: Invalid new_quantity {new_quantity} in ADD calculation")
+                logger.error("  🚨 ERROR: Invalid new_quantity %s in ADD calculation", new_quantity)
                 return OrderResult(
                     success=False,
                     status=OrderStatus.REJECTED,
@@ -918,9 +1068,9 @@ class ExecutionEngine:
 
             new_avg_price = ((old_avg_price * old_quantity) + (actual_add_price * quantity)) / new_quantity
 
-            print(f"  ✓ ADD filled: {quantity} @ ${actual_add_price:.2f}")
-            print(f"  Position: {old_quantity} @ ${old_avg_price:.2f} + {quantity} @ ${actual_add_price:.2f}")
-            print(f"  New Average: {new_quantity} @ ${new_avg_price:.2f}")
+            logger.info("  ✓ ADD filled: %s @ $%.2f", quantity, actual_add_price)
+            logger.info("  Position: %s @ $%.2f + %s @ $%.2f", old_quantity, old_avg_price, quantity, actual_add_price)
+            logger.info("  New Average: %s @ $%.2f", new_quantity, new_avg_price)
 
             # Update session
             session.total_quantity = new_quantity
@@ -940,14 +1090,106 @@ class ExecutionEngine:
             )
 
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("  ⚠️ Add execution error: %s", e)
             return OrderResult(
                 success=False,
                 status=OrderStatus.REJECTED,
                 message=f"Add execution error: {e}",
             )
 
+    async def _submit_entry_market(self, event: Event, contract: Option, quantity: int) -> Trade:
+        """Submit the entry as a MARKET order (IBKR paper or no real-time data)."""
+        parent_order = MarketOrder("BUY", quantity)
+        parent_trade = self.ib.placeOrder(contract, parent_order)
+        logger.info("  ⓘ MARKET order submitted for %s contracts", quantity)
+        return parent_trade
+
+    async def _submit_entry_limit(self, event: Event, contract: Option, quantity: int) -> Trade:
+        """Submit the entry as a LIMIT order with 5¢ flexibility (real-time data available)."""
+        # Get current market data
+        logger.info("  Fetching current market data...")
+        market_bid, market_ask, market_last = await self._quote(contract, timeout=1.0)
+
+        if market_bid and market_ask:
+            last_str = f"${market_last:.2f}" if market_last else "N/A"
+            logger.info("  📊 Market: Bid $%.2f | Ask $%.2f | Last %s", market_bid, market_ask, last_str)
+        elif market_last:
+            logger.info("  📊 Market: Last $%.2f", market_last)
+
+        # Determine entry price with 5-cent flexibility
+        alert_price = event.entry_price or (market_ask if market_ask else market_last)
+
+        if not alert_price:
+            logger.warning("  ⚠️ No market data available, falling back to MARKET order")
+            parent_order = MarketOrder("BUY", quantity)
+            parent_trade = self.ib.placeOrder(contract, parent_order)
+            logger.info("  ⓘ MARKET order submitted (no market data)")
+        else:
+            entry_price = alert_price
+            max_entry_price = alert_price + 0.05  # 5¢ flexibility
+
+            if market_ask:
+                if market_ask > entry_price and market_ask <= max_entry_price:
+                    # Market moved up but within tolerance
+                    old_price = entry_price
+                    entry_price = market_ask
+                    logger.info("  ⓘ Adjusting entry: $%.2f → $%.2f (market moved, within 5¢)", old_price, entry_price)
+                elif market_ask > max_entry_price:
+                    # Market moved too far, use max allowed
+                    deviation = market_ask - alert_price
+                    logger.warning("  ⚠️ Market ask $%.2f is $%.2f above alert $%.2f", market_ask, deviation, alert_price)
+                    logger.warning("  ⚠️ Using max allowed: $%.2f (alert + 5¢)", max_entry_price)
+                    entry_price = max_entry_price
+                elif market_ask < entry_price:
+                    # Better entry available
+                    old_price = entry_price
+                    entry_price = market_ask
+                    logger.info("  ✓ Better entry: $%.2f → $%.2f (below alert)", old_price, entry_price)
+
+            parent_order = LimitOrder("BUY", quantity, entry_price)
+            parent_order.tif = "DAY"
+            parent_trade = self.ib.placeOrder(contract, parent_order)
+            logger.info("  ⓘ LIMIT order submitted @ $%.2f", entry_price)
+        return parent_trade
+
+    async def _submit_add_market(self, event: Event, contract: Option, quantity: int) -> Trade:
+        """Submit an ADD as a MARKET order (IBKR paper or no real-time data)."""
+        order = MarketOrder("BUY", quantity)
+        trade = self.ib.placeOrder(contract, order)
+        logger.info("  ⓘ ADD MARKET order submitted: %s contracts", quantity)
+        return trade
+
+    async def _submit_add_limit(self, event: Event, contract: Option, quantity: int) -> Trade:
+        """Submit an ADD as a LIMIT order with 5¢ flexibility (real-time data available)."""
+        logger.info("  Fetching current market data...")
+        _, market_ask, market_last = await self._quote(contract, timeout=1.0)
+
+        add_price = event.entry_price or market_ask or market_last
+
+        if not add_price:
+            logger.warning("  ⚠️ No market data, falling back to MARKET order")
+            order = MarketOrder("BUY", quantity)
+            trade = self.ib.placeOrder(contract, order)
+            logger.info("  ⓘ ADD MARKET order submitted (no data)")
+        else:
+            # Allow 5¢ flexibility
+            if market_ask and market_ask > add_price:
+                if market_ask <= add_price + 0.05:
+                    logger.info("  ⓘ Adjusting ADD: $%.2f → $%.2f (within 5¢)", add_price, market_ask)
+                    add_price = market_ask
+                else:
+                    logger.warning("  ⚠️ Using max allowed: $%.2f", add_price + 0.05)
+                    add_price = add_price + 0.05
+            elif market_ask and market_ask < add_price:
+                logger.info("  ✓ Better ADD entry: $%.2f → $%.2f", add_price, market_ask)
+                add_price = market_ask
+
+            order = LimitOrder("BUY", quantity, add_price)
+            order.tif = "DAY"
+            trade = self.ib.placeOrder(contract, order)
+            logger.info("  ⓘ ADD LIMIT order submitted @ $%.2f", add_price)
+        return trade
+
     async def _execute_exit(
         self, event: Event, session: TradeSession
     ) -> OrderResult:
@@ -956,20 +1198,20 @@ class ExecutionEngine:
             # Get current position size from session
             total_quantity = session.total_quantity
 
-            print(f"  📊 EXIT check: Session {session.session_id[:8]}... has qty={total_quantity}")
-            print(f"     Session state: {session.state}, avg_entry={session.avg_entry_price}")
+            logger.info("  📊 EXIT check: Session %s... has qty=%s", session.session_id[:8], total_quantity)
+            logger.info("     Session state: %s, avg_entry=%s", session.state, session.avg_entry_price)
 
             # CRITICAL: If session says 0 but we think there's a position,
             # check IBKR directly (state sync bug protection)
             if total_quantity == 0:
-                print(f"  ⚠️ Session shows 0 quantity, checking IBKR positions...")
+                logger.warning("  ⚠️ Session shows 0 quantity, checking IBKR positions...")
 
                 # Build contract and check IBKR
-                contract = self._build_contract_from_session(session)
-                qualified = await self.ib.qualifyContractsAsync(contract)
+                contract = self._build_contract(session)
+                qualified = await self._qualify(contract)
 
                 if qualified:
-                    contract = qualified[0]
+                    contract = qualified
                     positions = self.ib.positions()
 
                     # Find matching position
@@ -979,8 +1221,8 @@ class ExecutionEngine:
                             pos.contract.conId == contract.conId):
                             ibkr_quantity = int(pos.position)
                             if ibkr_quantity > 0:
-                                print(f"  🔧 State sync fix: IBKR has {ibkr_quantity} contracts, session shows 0")
-                                print(f"  🔧 Using IBKR quantity for EXIT")
+                                logger.info("  🔧 State sync fix: IBKR has %s contracts, session shows 0", ibkr_quantity)
+                                logger.info("  🔧 Using IBKR quantity for EXIT")
                                 total_quantity = ibkr_quantity
                                 # Update session to fix state
                                 session.total_quantity = ibkr_quantity
@@ -994,31 +1236,45 @@ class ExecutionEngine:
                     message="No position to exit (confirmed with IBKR)",
                 )
 
-            contract = self._build_contract_from_session(session)
+            contract = self._build_contract(session)
 
             # Qualify contract with IBKR
-            qualified = await self.ib.qualifyContractsAsync(contract)
+            qualified = await self._qualify(contract)
             if not qualified:
                 return OrderResult(
                     success=False,
                     status=OrderStatus.REJECTED,
                     message=f"Contract not found: {contract.symbol} {contract.strike}{contract.right}",
                 )
-            contract = qualified[0]
-            print(f"  ✓ Qualified contract: {contract.localSymbol}")
+            contract = qualified
+            logger.info("  ✓ Qualified contract: %s", contract.localSymbol)
 
             # CRITICAL: Cancel all existing orders for this contract (bracket orders)
-            # This prevents race conditions between EXIT and existing stop/target orders
-            cancelled_orders = await self._cancel_orders_for_contract(contract)
-            if cancelled_orders > 0:
-                print(f"  ✓ Cancelled {cancelled_orders} existing order(s) (bracket stop/target)")
+            # FIRST to prevent SHORT positions (same rule as _execute_trim): a
+            # stop/target leg filling before its cancel lands would make the
+            # SELL below oversell. Wait for the acks, not a fixed delay.
+            cancelled_trades = self._issue_cancels_for_contract(contract)
+            if cancelled_trades:
+                logger.info("  ✓ Cancelled %s existing order(s) (bracket stop/target)", len(cancelled_trades))
+                await self._await_cancel_acks(cancelled_trades)
+
+                # A leg that filled in the meantime already sold part of the position
+                bracket_filled = int(sum(t.orderStatus.filled for t in cancelled_trades))
+                if bracket_filled:
+                    total_quantity -= bracket_filled
+                    logger.warning("  ⚠️ Bracket filled %s contract(s) before cancel - %s left to exit", bracket_filled, max(total_quantity, 0))
+                    if total_quantity <= 0:
+                        return OrderResult(
+                            success=False,
+                            status=OrderStatus.REJECTED,
+                            message="No position to exit (bracket filled before cancel)",
+                        )
 
             # Use MARKET order for fast exit (speed more important than price)
-            from ib_insync import MarketOrder
             order = MarketOrder("SELL", total_quantity)
             trade = self.ib.placeOrder(contract, order)
 
-            print(f"  ⓘ EXIT MARKET order submitted for {total_quantity} contracts")
+            logger.info("  ⓘ EXIT MARKET order submitted for %s contracts", total_quantity)
 
             # Market orders usually fill instantly, but monitor anyway
             filled = await self._wait_for_fill(
@@ -1034,6 +1290,7 @@ class ExecutionEngine:
                 session.state = SessionState.CLOSED
                 session.closed_at = now
                 session.updated_at = now  # Update timestamp
+                self.release_session_brackets(session)
 
                 return OrderResult(
                     success=True,
@@ -1090,8 +1347,8 @@ class ExecutionEngine:
                 )
 
             # Build contract
-            contract = self._build_contract_from_session(session)
-            qualified = await self.ib.qualifyContractsAsync(contract)
+            contract = self._build_contract(session)
+            qualified = await self._qualify(contract)
 
             if not qualified:
                 return OrderResult(
@@ -1100,8 +1357,8 @@ class ExecutionEngine:
                     message=f"Contract not found: {contract.symbol} {contract.strike}{contract.right}",
                 )
 
-            contract = qualified[0]
-            print(f"  ✓ Qualified contract: {contract.localSymbol}")
+            contract = qualified
+            logger.info("  ✓ Qualified contract: %s", contract.localSymbol)
 
             # CRITICAL: Cancel brackets FIRST to prevent SHORT positions
             # If trimming to 0, brackets must be cancelled before submitting TRIM
@@ -1113,16 +1370,15 @@ class ExecutionEngine:
                 if session.target_order_ids:
                     order_ids.extend(session.target_order_ids)
 
-                print(f"  ⓘ Cancelling {len(order_ids)} bracket order(s) before TRIM...")
+                logger.info("  ⓘ Cancelling %s bracket order(s) before TRIM...", len(order_ids))
                 await self._cancel_sibling_orders(order_ids)
-                print(f"  ✓ Brackets cancelled")
+                logger.info("  ✓ Brackets cancelled")
 
             # Use MARKET order for fast exit (speed more important than price)
-            from ib_insync import MarketOrder
             order = MarketOrder("SELL", trim_qty)
             trade = self.ib.placeOrder(contract, order)
 
-            print(f"  ⓘ TRIM MARKET order submitted: {trim_qty} contracts")
+            logger.info("  ⓘ TRIM MARKET order submitted: %s contracts", trim_qty)
 
             # Wait for fill with real-time Telegram updates
             filled = await self._wait_for_fill(
@@ -1153,7 +1409,7 @@ class ExecutionEngine:
 
             # Check if position is fully closed
             if session.total_quantity == 0:
-                print(f"  ⓘ TRIM reduced position to 0, auto-closing session")
+                logger.info("  ⓘ TRIM reduced position to 0, auto-closing session")
 
                 now = datetime.now(timezone.utc)
                 session.state = SessionState.CLOSED
@@ -1161,6 +1417,7 @@ class ExecutionEngine:
                 session.updated_at = now  # Update timestamp
                 session.exit_reason = "TRIM_TO_ZERO"
                 session.exit_price = fill_price
+                self.release_session_brackets(session)
 
                 # Note: Brackets already cancelled before TRIM order (see above)
 
@@ -1173,7 +1430,7 @@ class ExecutionEngine:
                 )
             else:
                 # Position still open, update brackets
-                print(f"  ⓘ Position trimmed: {current_quantity} → {session.total_quantity}")
+                logger.info("  ⓘ Position trimmed: %s → %s", current_quantity, session.total_quantity)
 
                 # Update brackets for reduced position
                 await self._update_brackets_for_trim(session, contract)
@@ -1187,8 +1444,7 @@ class ExecutionEngine:
                 )
 
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("  ⚠️ Trim execution error: %s", e)
             return OrderResult(
                 success=False,
                 status=OrderStatus.REJECTED,
@@ -1230,13 +1486,13 @@ class ExecutionEngine:
                 old_stop = session.avg_entry_price * (1 + session.stop_loss_percent / 100)
 
             if old_stop and new_stop_price < old_stop:
-                print(f"  ⚠️ Warning: New stop ${new_stop_price:.2f} is LOWER than old stop ${old_stop:.2f}")
-                print(f"  ⚠️ This INCREASES risk (stops should only tighten, not loosen)")
+                logger.warning("  ⚠️ Warning: New stop $%.2f is LOWER than old stop $%.2f", new_stop_price, old_stop)
+                logger.warning("  ⚠️ This INCREASES risk (stops should only tighten, not loosen)")
                 # Allow but warn - trader may have reasons
 
             # Build contract
-            contract = self._build_contract_from_session(session)
-            qualified = await self.ib.qualifyContractsAsync(contract)
+            contract = self._build_contract(session)
+            qualified = await self._qualify(contract)
 
             if not qualified:
                 return OrderResult(
@@ -1245,19 +1501,18 @@ class ExecutionEngine:
                     message=f"Contract not found: {contract.symbol} {contract.strike}{contract.right}",
                 )
 
-            contract = qualified[0]
-            print(f"  ✓ Qualified contract: {contract.localSymbol}")
+            contract = qualified
+            logger.info("  ✓ Qualified contract: %s", contract.localSymbol)
 
             # Cancel old stop order
             if session.stop_order_id:
-                print(f"  ⓘ Cancelling old stop order #{session.stop_order_id}...")
+                logger.info("  ⓘ Cancelling old stop order #%s...", session.stop_order_id)
                 await self._cancel_sibling_orders([session.stop_order_id])
-                print(f"  ✓ Old stop cancelled")
+                logger.info("  ✓ Old stop cancelled")
             else:
-                print(f"  ⓘ No existing stop order to cancel")
+                logger.info("  ⓘ No existing stop order to cancel")
 
             # Create new stop order at new price
-            from ib_insync import StopOrder
             oca_group = f"OCA_{session.session_id[:8]}"
 
             new_stop_order = StopOrder("SELL", session.total_quantity, new_stop_price)
@@ -1267,24 +1522,34 @@ class ExecutionEngine:
             new_stop_order.ocaType = 1
 
             stop_trade = self.ib.placeOrder(contract, new_stop_order)
-            await asyncio.sleep(0.2)
+            self._bracket_trades[stop_trade.order.orderId] = stop_trade
+            if not await self._await_order_accepted(stop_trade):
+                # The old stop is already gone - record that, don't claim the rejected one
+                self._discard_unaccepted(stop_trade)
+                self._set_brackets(session, None, session.target_order_ids)
+                logger.error("  🚨 CRITICAL: New stop @ $%.2f was not accepted - position has NO stop!", new_stop_price)
+                return OrderResult(
+                    success=False,
+                    status=OrderStatus.REJECTED,
+                    message=f"New stop @ ${new_stop_price:.2f} not accepted ({stop_trade.orderStatus.status}) - position has NO stop",
+                )
 
             # Update session with new stop
-            session.stop_order_id = stop_trade.order.orderId
+            self._set_brackets(session, stop_trade.order.orderId, session.target_order_ids)
 
             # Recalculate stop percentage based on new price
             if session.avg_entry_price > 0:
                 session.stop_loss_percent = ((new_stop_price - session.avg_entry_price) / session.avg_entry_price) * 100
-                print(f"  ✓ New stop: ${new_stop_price:.2f} ({session.stop_loss_percent:+.1f}% from entry)")
+                logger.info("  ✓ New stop: $%.2f (%+.1f%% from entry)", new_stop_price, session.stop_loss_percent)
             else:
-                print(f"  ✓ New stop: ${new_stop_price:.2f}")
+                logger.info("  ✓ New stop: $%.2f", new_stop_price)
 
-            print(f"  ✓ Stop order #{stop_trade.order.orderId} created")
+            logger.info("  ✓ Stop order #%s created", stop_trade.order.orderId)
 
             # Calculate risk reduction
             if old_stop:
                 risk_reduction = new_stop_price - old_stop
-                print(f"  📊 Risk reduced by ${risk_reduction:.2f} per contract")
+                logger.info("  📊 Risk reduced by $%.2f per contract", risk_reduction)
 
             return OrderResult(
                 success=True,
@@ -1294,49 +1559,110 @@ class ExecutionEngine:
             )
 
         except Exception as e:
-            import traceback
-            traceback.print_exc()
+            logger.exception("  ⚠️ MOVE_STOP execution error: %s", e)
             return OrderResult(
                 success=False,
                 status=OrderStatus.REJECTED,
                 message=f"MOVE_STOP execution error: {e}",
             )
 
-    def _build_contract(self, event: Event) -> Option:
-        """Build IBKR Option contract from event."""
-        # Convert expiry from ISO format (2025-12-12) to IBKR format (20251212)
-        expiry_ibkr = event.expiry.replace('-', '') if event.expiry else ''
+    def _today_ibkr(self) -> str:
+        """Today's date as an IBKR expiry string (20251212), recomputed once per day."""
+        today = date.today().isoformat()
+        if self._today_expiry[0] != today:
+            self._today_expiry = (today, today.replace('-', ''))
+        return self._today_expiry[1]
 
-        # Map underlying to IBKR symbol (SPY and QQQ only)
-        if event.underlying in ["SPY", "QQQ"]:
-            symbol = event.underlying
-        else:
-            symbol = event.underlying  # Fallback to raw value
+    async def _qualify(self, contract: Contract) -> Optional[Contract]:
+        """
+        Qualify a contract with IBKR, memoized per strike.
 
-        return Option(
-            symbol=symbol,
-            lastTradeDateOrContractMonth=expiry_ibkr,
-            strike=event.strike,
-            right="C" if event.direction == Direction.CALL else "P",
-            exchange="SMART",
+        Contract details don't change intraday, so repeat orders on the same
+        contract skip the round-trip. The details' minTick is kept for
+        _round_to_tick. Returns None if IBKR doesn't know it.
+        """
+        # Start each trading day empty (expired strikes never come back)
+        today = self._today_ibkr()
+        if today != self._qualified_day:
+            self._qualified.clear()
+            self._min_ticks.clear()
+            self._session_contracts.clear()
+            self._qualified_day = today
+
+        key = (
+            contract.secType,
+            contract.symbol,
+            contract.lastTradeDateOrContractMonth,
+            contract.strike,
+            contract.right,
+            contract.exchange,
         )
+        cached = self._qualified.get(key)
+        if cached is not None:
+            self._qualified.move_to_end(key)
+            return cached
 
-    def _build_contract_from_session(self, session: TradeSession) -> Option:
-        """Build IBKR Option contract from session."""
-        # Convert expiry from ISO format (2025-12-12) to IBKR format (20251212)
-        expiry_ibkr = session.expiry.replace('-', '') if session.expiry else ''
-
-        # Map underlying to IBKR symbol (SPY and QQQ only)
-        if session.underlying in ["SPY", "QQQ"]:
-            symbol = session.underlying
-        else:
-            symbol = session.underlying  # Fallback to raw value
+        inflight = self._qualify_inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
 
+        future = asyncio.get_running_loop().create_future()
+        self._qualify_inflight[key] = future
+        try:
+            # Same steps as qualifyContractsAsync, keeping the details' minTick
+            details = await self.ib.reqContractDetailsAsync(contract)
+            result = None
+            if not details:
+                logger.warning("  ⚠️ Unknown contract: %s", contract)
+            elif len(details) > 1:
+                logger.warning("  ⚠️ Ambiguous contract: %s (%d matches)", contract, len(details))
+            else:
+                result = details[0].contract
+                if result.lastTradeDateOrContractMonth:
+                    # Drop the time/timezone suffix, it breaks order placement
+                    result.lastTradeDateOrContractMonth = result.lastTradeDateOrContractMonth.split()[0]
+                if contract.exchange == "SMART":
+                    result.exchange = contract.exchange
+                if details[0].minTick:
+                    self._min_ticks[result.conId] = details[0].minTick
+            if result is not None:
+                self._qualified[key] = result
+                if len(self._qualified) > self._QUALIFIED_MAX:
+                    self._qualified.popitem(last=False)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a failure nobody else awaited isn't logged by the loop
+            future.exception()
+            raise
+        finally:
+            self._qualify_inflight.pop(key, None)
+
+    def _round_to_tick(self, price: float, contract: Optional[Contract] = None) -> float:
+        """Round a premium to the contract's minimum tick (0.01 if unknown)."""
+        tick = self._min_ticks.get(contract.conId, 0.01) if contract is not None else 0.01
+        return round(round(price / tick) * tick, 4)
+
+    def _build_contract(self, source: Event | TradeSession) -> Option:
+        """Build IBKR Option contract from an event or session (both carry the same fields)."""
+        if isinstance(source, TradeSession):
+            contract = self._session_contracts.get(source.session_id)
+            if contract is None:
+                contract = self._session_contracts[source.session_id] = self._new_contract(source)
+            return contract
+        return self._new_contract(source)
+
+    @staticmethod
+    def _new_contract(source: Event | TradeSession) -> Option:
         return Option(
-            symbol=symbol,
-            lastTradeDateOrContractMonth=expiry_ibkr,
-            strike=session.strike,
-            right="C" if session.direction == Direction.CALL else "P",
+            symbol=source.underlying,  # SPY/QQQ map 1:1 to IBKR symbols
+            lastTradeDateOrContractMonth=_expiry_ibkr(source.expiry),
+            strike=source.strike,
+            right=_RIGHT_MAP.get(source.direction, "P"),
             exchange="SMART",
         )
 
@@ -1356,8 +1682,6 @@ class ExecutionEngine:
 
         Returns list of orders: [parent, stop_child, target_child]
         """
-        from ib_insync import Order
-
         orders = []
 
         # Parent order (entry) - don't transmit yet if we have children
@@ -1402,7 +1726,7 @@ class ExecutionEngine:
         percent = ((price - base_price) / base_price) * 100
 
         if percent < -99 or percent > 1000:
-            print(f"  ⚠️ WARNING: Extreme {label}: {percent:.2f}%")
+            logger.warning("  ⚠️ WARNING: Extreme %s: %.2f%%", label, percent)
 
         return percent
 
@@ -1412,8 +1736,8 @@ class ExecutionEngine:
             return stop_price
 
         if stop_price >= entry_price:
-            print(f"  ⚠️ WARNING: Stop ${stop_price:.2f} is above/equal to entry ${entry_price:.2f}")
-            print(f"  ⚠️ For LONG positions, stop must be BELOW entry. Using auto-calculated stop.")
+            logger.warning("  ⚠️ WARNING: Stop $%.2f is above/equal to entry $%.2f", stop_price, entry_price)
+            logger.warning("  ⚠️ For LONG positions, stop must be BELOW entry. Using auto-calculated stop.")
             return None
 
         return stop_price
@@ -1424,13 +1748,13 @@ class ExecutionEngine:
             return target_price
 
         if target_price > 50:
-            print(f"  ⚠️ WARNING: Target ${target_price:.2f} seems too high for option premium")
-            print(f"  ⚠️ This might be a stock price, not premium. Using auto-calculated target instead.")
+            logger.warning("  ⚠️ WARNING: Target $%.2f seems too high for option premium", target_price)
+            logger.warning("  ⚠️ This might be a stock price, not premium. Using auto-calculated target instead.")
             return None
 
         if target_price <= entry_price:
-            print(f"  ⚠️ WARNING: Target ${target_price:.2f} is below/equal to entry ${entry_price:.2f}")
-            print(f"  ⚠️ For LONG positions, target must be ABOVE entry. Using auto-calculated target.")
+            logger.warning("  ⚠️ WARNING: Target $%.2f is below/equal to entry $%.2f", target_price, entry_price)
+            logger.warning("  ⚠️ For LONG positions, target must be ABOVE entry. Using auto-calculated target.")
             return None
 
         return target_price
@@ -1440,6 +1764,7 @@ class ExecutionEngine:
         actual_fill_price: float,
         original_stop: Optional[float],
         original_target: Optional[float],
+        contract: Optional[Contract] = None,
     ) -> tuple[Optional[float], Optional[float]]:
         """
         Calculate bracket prices based on actual fill price.
@@ -1452,6 +1777,7 @@ class ExecutionEngine:
             actual_fill_price: Actual fill price from parent order
             original_stop: Original stop price from Discord (or None)
             original_target: Original target price from Discord (or None)
+            contract: Qualified contract, for its minimum tick (or None)
 
         Returns:
             (stop_price, target_price) tuple
@@ -1465,7 +1791,7 @@ class ExecutionEngine:
             # Get stop percent from config (default: 50% for options)
             stop_percent = self.config.get('risk', {}).get('auto_stop_loss_percent', 50.0)
             stop_price = actual_fill_price * (1 - stop_percent / 100)
-            print(f"  ⓘ Auto stop-loss: ${stop_price:.2f} ({stop_percent}% below fill)")
+            logger.info("  ⓘ Auto stop-loss: $%.2f (%s%% below fill)", stop_price, stop_percent)
 
         if not target_price:
             # Get risk/reward ratio from config (default: 0.6 for 0DTE)
@@ -1474,22 +1800,22 @@ class ExecutionEngine:
 
             # Validate risk is positive (stop is below entry)
             if risk <= 0:
-                print(f"  ⚠️ WARNING: Negative/zero risk detected (entry: ${actual_fill_price:.2f}, stop: ${stop_price:.2f})")
-                print(f"  ⚠️ Recalculating both stop and target with config defaults")
+                logger.warning("  ⚠️ WARNING: Negative/zero risk detected (entry: $%.2f, stop: $%.2f)", actual_fill_price, stop_price)
+                logger.warning("  ⚠️ Recalculating both stop and target with config defaults")
                 # Recalculate stop with config percentage
                 stop_percent = self.config.get('risk', {}).get('auto_stop_loss_percent', 50.0)
                 stop_price = actual_fill_price * (1 - stop_percent / 100)
                 risk = actual_fill_price - stop_price
-                print(f"  ⓘ Auto stop-loss: ${stop_price:.2f} ({stop_percent}% below fill)")
+                logger.info("  ⓘ Auto stop-loss: $%.2f (%s%% below fill)", stop_price, stop_percent)
 
             target_price = actual_fill_price + (risk * rr_ratio)
-            print(f"  ⓘ Auto target: ${target_price:.2f} (R:R = 1:{rr_ratio})")
+            logger.info("  ⓘ Auto target: $%.2f (R:R = 1:%s)", target_price, rr_ratio)
 
-        # Round to 2 decimals for option premiums
+        # Round to the contract's tick size
         if stop_price:
-            stop_price = round(stop_price, 2)
+            stop_price = self._round_to_tick(stop_price, contract)
         if target_price:
-            target_price = round(target_price, 2)
+            target_price = self._round_to_tick(target_price, contract)
 
         return stop_price, target_price
 
@@ -1525,18 +1851,17 @@ class ExecutionEngine:
             # IBKR will automatically cancel other orders in same OCA group when one fills
             oca_group = f"OCA_{session.session_id[:8]}"
 
+            # Build both legs first, then place them back-to-back so the OCO pair
+            # reaches TWS together, and wait for both acks at once
+            stop_order = target_order = None
+
             # Create stop loss order (STOP order triggers when price drops to stop_price)
             if stop_price:
-                from ib_insync import StopOrder
                 stop_order = StopOrder("SELL", quantity, stop_price)
                 stop_order.tif = "DAY"
                 stop_order.outsideRth = True  # Allow stop to work outside regular hours
                 stop_order.ocaGroup = oca_group  # Link to OCO group
                 stop_order.ocaType = 1  # 1 = Cancel all other orders in group on fill
-                stop_trade = self.ib.placeOrder(contract, stop_order)
-                await asyncio.sleep(0.2)  # Small delay for order submission
-                order_ids['stop_order_id'] = stop_trade.order.orderId
-                print(f"  ✓ Stop order created: ${stop_price:.2f} (Order #{stop_trade.order.orderId}, OCO: {oca_group})")
 
             # Create target order
             if target_price:
@@ -1545,21 +1870,78 @@ class ExecutionEngine:
                 target_order.outsideRth = True  # Allow target to work outside regular hours
                 target_order.ocaGroup = oca_group  # Link to same OCO group
                 target_order.ocaType = 1  # 1 = Cancel all other orders in group on fill
-                target_trade = self.ib.placeOrder(contract, target_order)
-                await asyncio.sleep(0.2)
+
+            stop_trade = self.ib.placeOrder(contract, stop_order) if stop_order else None
+            target_trade = self.ib.placeOrder(contract, target_order) if target_order else None
+            pending = [t for t in (stop_trade, target_trade) if t]
+            for placed in pending:
+                self._bracket_trades[placed.order.orderId] = placed
+            acks = iter(await asyncio.gather(*(self._await_order_accepted(t) for t in pending)))
+            stop_ok = next(acks) if stop_trade else True
+            target_ok = next(acks) if target_trade else True
+
+            if not stop_ok:
+                # No stop means no bracket: pull the target too and let the caller
+                # handle an unprotected position
+                logger.error("  🚨 Stop order #%s was not accepted (%s)", stop_trade.order.orderId, stop_trade.orderStatus.status)
+                for placed in pending:
+                    self._discard_unaccepted(placed)
+                return None
+
+            if not target_ok:
+                logger.warning("  ⚠️ Target order #%s was not accepted (%s) - stop only", target_trade.order.orderId, target_trade.orderStatus.status)
+                self._discard_unaccepted(target_trade)
+                target_trade = None
+
+            if stop_trade:
+                order_ids['stop_order_id'] = stop_trade.order.orderId
+                logger.info("  ✓ Stop order created: $%.2f (Order #%s, OCO: %s)", stop_price, stop_trade.order.orderId, oca_group)
+
+            if target_trade:
                 order_ids['target_order_ids'] = [target_trade.order.orderId]
-                print(f"  ✓ Target order created: ${target_price:.2f} (Order #{target_trade.order.orderId}, OCO: {oca_group})")
+                logger.info("  ✓ Target order created: $%.2f (Order #%s, OCO: %s)", target_price, target_trade.order.orderId, oca_group)
 
             # Log OCO confirmation
-            if stop_price and target_price:
-                print(f"  ✓ OCO group '{oca_group}' created - IBKR will auto-cancel remaining order when one fills")
+            if stop_trade and target_trade:
+                logger.info("  ✓ OCO group '%s' created - IBKR will auto-cancel remaining order when one fills", oca_group)
 
             return order_ids
 
         except Exception as e:
-            print(f"  ⚠️ Failed to create bracket orders: {e}")
+            logger.error("  ⚠️ Failed to create bracket orders: %s", e)
             return None
 
+    def _discard_unaccepted(self, trade: Trade) -> None:
+        """Cancel a bracket leg that wasn't (or isn't yet) accepted and forget it."""
+        self._bracket_trades.pop(trade.order.orderId, None)
+        if trade.orderStatus.status not in _FINAL_STATES:
+            self.ib.cancelOrder(trade.order)
+
+    async def _await_order_accepted(self, trade: Trade, timeout: float = 2.0) -> bool:
+        """
+        Wait until IBKR acknowledges an order (Submitted, not filled).
+
+        Returns False, with a warning, if the order is rejected/cancelled or
+        no ack arrives within the timeout. The order is left as is either way.
+        """
+
+        answered = _ACCEPTED_STATES | _PREFILL_CANCEL_STATES
+
+        async def _acked() -> None:
+            while trade.orderStatus.status not in answered:
+                await trade.statusEvent
+
+        try:
+            await asyncio.wait_for(_acked(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("  ⚠️ Order #%s not acknowledged within %.1fs (status: %s)", trade.order.orderId, timeout, trade.orderStatus.status)
+            return False
+
+        if trade.orderStatus.status in _PREFILL_CANCEL_STATES:
+            logger.warning("  ⚠️ Order #%s was not accepted (status: %s)", trade.order.orderId, trade.orderStatus.status)
+            return False
+        return True
+
     def _calculate_trim_quantity(self, event: Event, session: TradeSession) -> int:
         """
         Calculate trim quantity from event.
@@ -1608,11 +1990,11 @@ class ExecutionEngine:
         try:
             # Check session state to prevent race condition with position reconciliation
             if session.state != SessionState.OPEN:
-                print(f"    ⚠️ Skipping bracket update - session is {session.state.value}, not OPEN")
+                logger.warning("    ⚠️ Skipping bracket update - session is %s, not OPEN", session.state.value)
                 return
 
             # Create new brackets after TRIM
-            print(f"    Creating new brackets after TRIM...")
+            logger.info("    Creating new brackets after TRIM...")
 
             # Note: Old brackets already cancelled before TRIM order
             # No need to cancel again - just create new ones
@@ -1623,11 +2005,11 @@ class ExecutionEngine:
 
             if session.stop_loss_percent is not None:
                 new_stop = session.avg_entry_price * (1 + session.stop_loss_percent / 100)
-                new_stop = round(new_stop, 2)
+                new_stop = self._round_to_tick(new_stop, contract)
 
             if session.target_percent is not None:
                 new_target = session.avg_entry_price * (1 + session.target_percent / 100)
-                new_target = round(new_target, 2)
+                new_target = self._round_to_tick(new_target, contract)
 
             # Create new brackets with updated quantity
             if new_stop or new_target:
@@ -1641,13 +2023,16 @@ class ExecutionEngine:
 
                 # Update session with new bracket IDs
                 if bracket_result:
-                    session.stop_order_id = bracket_result.get('stop_order_id')
-                    session.target_order_ids = bracket_result.get('target_order_ids', [])
-                    print(f"    ✓ New brackets created for {session.total_quantity} contracts")
+                    self._set_brackets(
+                        session,
+                        bracket_result.get('stop_order_id'),
+                        bracket_result.get('target_order_ids', []),
+                    )
+                    logger.info("    ✓ New brackets created for %s contracts", session.total_quantity)
 
         except Exception as e:
-            print(f"    ⚠️ Failed to update brackets after TRIM: {e}")
-            print(f"    ⚠️ Position may be unprotected - manual monitoring required!")
+            logger.error("    ⚠️ Failed to update brackets after TRIM: %s", e)
+            logger.warning("    ⚠️ Position may be unprotected - manual monitoring required!")
 
     async def _update_brackets_for_add(self, session: TradeSession, contract: Option):
         """
@@ -1665,11 +2050,11 @@ class ExecutionEngine:
         try:
             # Check session state to prevent race condition with position reconciliation
             if session.state != SessionState.OPEN:
-                print(f"    ⚠️ Skipping bracket update - session is {session.state.value}, not OPEN")
+                logger.warning("    ⚠️ Skipping bracket update - session is %s, not OPEN", session.state.value)
                 return
 
             # Cancel old brackets
-            print(f"    Updating brackets for new average...")
+            logger.info("    Updating brackets for new average...")
 
             order_ids_to_cancel = []
             if session.stop_order_id:
@@ -1679,7 +2064,7 @@ class ExecutionEngine:
 
             if order_ids_to_cancel:
                 await self._cancel_sibling_orders(order_ids_to_cancel)
-                print(f"    ✓ Cancelled {len(order_ids_to_cancel)} old bracket order(s)")
+                logger.info("    ✓ Cancelled %s old bracket order(s)", len(order_ids_to_cancel))
 
             # Calculate new bracket prices using percentages
             new_avg = session.avg_entry_price
@@ -1689,13 +2074,13 @@ class ExecutionEngine:
             if session.stop_loss_percent is not None:
                 # Apply same percentage offset to new average
                 new_stop = new_avg * (1 + session.stop_loss_percent / 100)
-                new_stop = round(new_stop, 2)
-                print(f"    New Stop: ${new_stop:.2f} ({session.stop_loss_percent:+.1f}% from avg)")
+                new_stop = self._round_to_tick(new_stop, contract)
+                logger.info("    New Stop: $%.2f (%+.1f%% from avg)", new_stop, session.stop_loss_percent)
 
             if session.target_percent is not None:
                 new_target = new_avg * (1 + session.target_percent / 100)
-                new_target = round(new_target, 2)
-                print(f"    New Target: ${new_target:.2f} ({session.target_percent:+.1f}% from avg)")
+                new_target = self._round_to_tick(new_target, contract)
+                logger.info("    New Target: $%.2f (%+.1f%% from avg)", new_target, session.target_percent)
 
             # Create new brackets with updated quantity and prices
             if new_stop or new_target:
@@ -1709,69 +2094,78 @@ class ExecutionEngine:
 
                 # Update session with new bracket IDs
                 if bracket_result:
-                    session.stop_order_id = bracket_result.get('stop_order_id')
-                    session.target_order_ids = bracket_result.get('target_order_ids', [])
-                    print(f"    ✓ New brackets created for {session.total_quantity} contracts")
+                    self._set_brackets(
+                        session,
+                        bracket_result.get('stop_order_id'),
+                        bracket_result.get('target_order_ids', []),
+                    )
+                    logger.info("    ✓ New brackets created for %s contracts", session.total_quantity)
             else:
-                print(f"    ⓘ No bracket percentages stored, skipping bracket update")
+                logger.info("    ⓘ No bracket percentages stored, skipping bracket update")
 
         except Exception as e:
-            print(f"    ⚠️ Failed to update brackets after ADD: {e}")
-            print(f"    ⚠️ Position may be unprotected - manual monitoring required!")
+            logger.error("    ⚠️ Failed to update brackets after ADD: %s", e)
+            logger.warning("    ⚠️ Position may be unprotected - manual monitoring required!")
 
-    async def _cancel_orders_for_contract(self, contract: Option) -> int:
+    def _issue_cancels_for_contract(self, contract: Option) -> list[Trade]:
         """
-        Cancel all open orders for a given contract.
+        Send cancels for all open orders on a given contract.
 
         This is essential before placing EXIT orders to avoid race conditions
-        with existing bracket orders (stop loss / take profit).
+        with existing bracket orders (stop loss / take profit). Does not wait
+        for IBKR to confirm - see _await_cancel_acks.
 
         Returns:
-            Number of orders cancelled
+            Trades that were sent a cancel
         """
         try:
-            # Get all open trades
-            open_trades = self.ib.openTrades()
+            # Contract identity, computed once for the scan
+            key = (contract.symbol, contract.strike, contract.right, contract.lastTradeDateOrContractMonth)
 
-            cancelled_count = 0
-            for trade in open_trades:
+            cancelled = []
+            for trade in self.ib.openTrades():
                 # Check if this trade is for the same contract
-                if (trade.contract.symbol == contract.symbol and
-                    trade.contract.strike == contract.strike and
-                    trade.contract.right == contract.right and
-                    trade.contract.lastTradeDateOrContractMonth == contract.lastTradeDateOrContractMonth):
+                c = trade.contract
+                if (c.symbol, c.strike, c.right, c.lastTradeDateOrContractMonth) == key:
 
                     # Cancel the order
                     self.ib.cancelOrder(trade.order)
-                    cancelled_count += 1
-                    print(f"    Cancelled order {trade.order.orderId}: {trade.order.action} {trade.order.totalQuantity} @ ${trade.order.lmtPrice}")
+                    cancelled.append(trade)
+                    logger.info("    Cancelled order %s: %s %s @ $%s", trade.order.orderId, trade.order.action, trade.order.totalQuantity, trade.order.lmtPrice)
 
-            # Give IBKR a moment to process cancellations
-            if cancelled_count > 0:
-                await asyncio.sleep(0.5)
-
-            return cancelled_count
+            return cancelled
         except Exception as e:
-            print(f"  ⚠️  Error cancelling orders: {e}")
-            return 0
+            logger.error("  ⚠️  Error cancelling orders: %s", e)
+            return []
+
+    async def _await_cancel_acks(self, trades: list[Trade], timeout: float = 2.0) -> bool:
+        """Wait until every cancelled trade reaches a done state; False on timeout."""
+
+        async def _done(trade: Trade) -> None:
+            while not trade.isDone():
+                await trade.statusEvent
+
+        pending = [t for t in trades if not t.isDone()]
+        if not pending:
+            return True
+        try:
+            await asyncio.wait_for(asyncio.gather(*(_done(t) for t in pending)), timeout)
+            return True
+        except asyncio.TimeoutError:
+            open_ids = [t.order.orderId for t in pending if not t.isDone()]
+            logger.warning("  ⚠️ Cancel not confirmed within %.1fs for order(s) %s", timeout, open_ids)
+            return False
 
     async def _get_market_price(self, contract: Option) -> Optional[float]:
         """Get current market price for contract."""
         try:
-            import math
-
             # Use async qualification (contract should already be qualified, but ensure)
-            qualified = await self.ib.qualifyContractsAsync(contract)
+            qualified = await self._qualify(contract)
             if qualified:
-                contract = qualified[0]
+                contract = qualified
 
-            ticker = self.ib.reqMktData(contract)
-            await asyncio.sleep(2)  # Wait for data (longer for delayed data)
-
-            # Clean NaN values
-            bid = ticker.bid if ticker.bid and not math.isnan(ticker.bid) else None
-            ask = ticker.ask if ticker.ask and not math.isnan(ticker.ask) else None
-            last = ticker.last if ticker.last and not math.isnan(ticker.last) else None
+            # Up to 2s for delayed data
+            bid, ask, last = await self._quote(contract, timeout=2.0)
 
             # Use midpoint of bid/ask
             if bid and ask:
@@ -1781,9 +2175,89 @@ class ExecutionEngine:
 
             return None
         except Exception as e:
-            print(f"Error getting market price: {e}")
+            logger.error("Error getting market price: %s", e)
             return None
 
+    async def _quote(
+        self, contract: Contract, timeout: float
+    ) -> tuple[Optional[float], Optional[float], Optional[float]]:
+        """
+        Current (bid, ask, last) for a contract, None where unavailable.
+
+        Wakes on ticker updates and returns as soon as both sides are quoted,
+        or after `timeout` with whatever arrived. The subscription is always
+        cancelled so repeat lookups don't accumulate market data lines.
+        """
+        ticker = self.ib.reqMktData(contract)
+        try:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while not (_price(ticker.bid) and _price(ticker.ask)):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(ticker.updateEvent, remaining)
+                except asyncio.TimeoutError:
+                    break
+        finally:
+            self.ib.cancelMktData(contract)
+
+        return _price(ticker.bid), _price(ticker.ask), _price(ticker.last)
+
+    async def _get_market_prices(
+        self, contracts: list[Contract], timeout: float = 2.0
+    ) -> list[Optional[float]]:
+        """
+        Current prices for several contracts under one shared deadline.
+
+        All subscriptions open at once; the wait ends when every contract has
+        a live price (last, or both bid and ask) or at `timeout`, and each keeps
+        whatever arrived - a slow quote only loses its own price. Each price is
+        the last trade, falling back to the bid/ask midpoint and then the
+        previous close. Entries are None where no price is available.
+        """
+        if not contracts:
+            return []
+
+        tickers = []
+        try:
+            for contract in contracts:
+                tickers.append(self.ib.reqMktData(contract))
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while not all(
+                _price(t.last) or (_price(t.bid) and _price(t.ask)) for t in tickers
+            ):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self.ib.pendingTickersEvent, remaining)
+                except asyncio.TimeoutError:
+                    break
+        except Exception as e:
+            logger.error("Error getting market prices: %s", e)
+        finally:
+            for ticker in tickers:
+                self.ib.cancelMktData(ticker.contract)
+
+        if len(tickers) < len(contracts):
+            return [None] * len(contracts)
+
+        # Columns: last, bid, ask, close
+        quotes = np.array(
+            [(t.last, t.bid, t.ask, t.close) for t in tickers], dtype=float
+        ).reshape(-1, 4)
+        quotes[quotes <= 0] = np.nan  # IBKR uses -1/0 for "no quote"
+
+        prices = quotes[:, 0]
+        prices = np.where(np.isnan(prices), quotes[:, 1:3].mean(axis=1), prices)  # NaN unless both sides quoted
+        prices = np.where(np.isnan(prices), quotes[:, 3], prices)
+
+        return [None if np.isnan(p) else float(p) for p in prices]
+
     async def _get_underlying_price(self, underlying_symbol: str) -> Optional[float]:
         """
         Get current stock price for underlying asset.
@@ -1795,28 +2269,19 @@ class ExecutionEngine:
             Current stock price or None on error
         """
         try:
-            from ib_insync import Stock
-
             # Create stock contract
             stock = Stock(symbol=underlying_symbol, exchange="SMART", currency="USD")
 
             # Qualify contract
-            qualified = await self.ib.qualifyContractsAsync(stock)
+            qualified = await self._qualify(stock)
             if not qualified:
-                print(f"  ⚠️ Could not qualify stock contract for {underlying_symbol}")
+                logger.warning("  ⚠️ Could not qualify stock contract for %s", underlying_symbol)
                 return None
 
-            stock = qualified[0]
-
-            # Get market data
-            import math
-            ticker = self.ib.reqMktData(stock)
-            await asyncio.sleep(2)  # Wait for data (longer for delayed data)
+            stock = qualified
 
-            # Clean NaN values
-            last = ticker.last if ticker.last and not math.isnan(ticker.last) else None
-            bid = ticker.bid if ticker.bid and not math.isnan(ticker.bid) else None
-            ask = ticker.ask if ticker.ask and not math.isnan(ticker.ask) else None
+            # Get market data (up to 2s for delayed data)
+            bid, ask, last = await self._quote(stock, timeout=2.0)
 
             # Use last price or midpoint
             if last:
@@ -1827,7 +2292,7 @@ class ExecutionEngine:
             return None
 
         except Exception as e:
-            print(f"  ⚠️ Failed to get underlying price for {underlying_symbol}: {e}")
+            logger.error("  ⚠️ Failed to get underlying price for %s: %s", underlying_symbol, e)
             return None
 
     async def _convert_underlying_target_to_premium(
@@ -1857,7 +2322,7 @@ class ExecutionEngine:
             # Get current option premium
             current_premium = await self._get_market_price(contract)
             if not current_premium or current_premium <= 0:
-                print(f"  ⚠️ Could not get current premium for target conversion")
+                logger.warning("  ⚠️ Could not get current premium for target conversion")
                 return None
 
             strike = contract.strike
@@ -1883,16 +2348,16 @@ class ExecutionEngine:
 
             # Sanity check: premium should be positive and reasonable
             if estimated_premium <= 0:
-                print(f"  ⚠️ Invalid premium estimate: ${estimated_premium:.2f}")
+                logger.warning("  ⚠️ Invalid premium estimate: $%.2f", estimated_premium)
                 return None
 
-            print(f"  ⓘ Underlying target ${underlying_target:.2f} → Premium estimate ${estimated_premium:.2f}")
-            print(f"     (Current: ${current_underlying_price:.2f} underlying, ${current_premium:.2f} premium)")
+            logger.info("  ⓘ Underlying target $%.2f → Premium estimate $%.2f", underlying_target, estimated_premium)
+            logger.info("     (Current: $%.2f underlying, $%.2f premium)", current_underlying_price, current_premium)
 
             return estimated_premium
 
         except Exception as e:
-            print(f"  ⚠️ Failed to convert underlying target: {e}")
+            logger.error("  ⚠️ Failed to convert underlying target: %s", e)
             return None
 
     async def _wait_for_fill(
@@ -1914,8 +2379,8 @@ class ExecutionEngine:
         # Check initial status immediately
         if trade.orderStatus.status == "Filled":
             return True
-        if trade.orderStatus.status in ["Cancelled", "ApiCancelled", "Inactive"]:
-            print(f"  ✗ Order cancelled: {trade.orderStatus.status}")
+        if trade.orderStatus.status in _PREFILL_CANCEL_STATES:
+            logger.warning("  ✗ Order cancelled: %s", trade.orderStatus.status)
             return False
 
         # Get contract info for market data
@@ -1929,82 +2394,97 @@ class ExecutionEngine:
         if is_limit_order:
             try:
                 ticker = self.ib.reqMktData(contract, snapshot=False)
-                # Wait longer for market data to populate (up to 3 seconds)
-                for attempt in range(6):  # 6 attempts × 0.5s = 3 seconds
-                    await asyncio.sleep(0.5)
-
+                # Wait for market data to populate (up to 3 seconds), waking on ticker updates
+                data_deadline = time.monotonic() + 3.0
+                while True:
                     # Check if we got valid market data
-                    import math
-                    bid_valid = ticker.bid and not math.isnan(ticker.bid)
-                    ask_valid = ticker.ask and not math.isnan(ticker.ask)
-                    last_valid = ticker.last and not math.isnan(ticker.last)
-
-                    if bid_valid or ask_valid or last_valid:
-                        if bid_valid and ask_valid:
-                            print(f"  ✓ Live market data: Bid ${ticker.bid:.2f} / Ask ${ticker.ask:.2f}")
-                        elif last_valid:
-                            print(f"  ✓ Last trade: ${ticker.last:.2f} (delayed)")
+                    bid, ask, last = _price(ticker.bid), _price(ticker.ask), _price(ticker.last)
+
+                    if bid or ask or last:
+                        if bid and ask:
+                            logger.info("  ✓ Live market data: Bid $%.2f / Ask $%.2f", bid, ask)
+                        elif last:
+                            logger.info("  ✓ Last trade: $%.2f (delayed)", last)
+                        break
+
+                    remaining = data_deadline - time.monotonic()
+                    if remaining <= 0:
+                        logger.warning("  ⚠️ No market data after 3s (markets closed or no subscription)")
+                        logger.info("     You'll see 'Market data pending...' in Telegram updates")
                         break
 
-                    if attempt == 5:  # Last attempt
-                        print(f"  ⚠️ No market data after 3s (markets closed or no subscription)")
-                        print(f"     You'll see 'Market data pending...' in Telegram updates")
+                    try:
+                        await asyncio.wait_for(ticker.updateEvent, remaining)
+                    except asyncio.TimeoutError:
+                        pass
             except Exception as e:
-                print(f"  ⚠️ Market data request failed: {e}")
+                logger.error("  ⚠️ Market data request failed: %s", e)
                 ticker = None
 
-        # Wait for status changes with periodic Telegram updates
-        last_telegram_update = 0
-        telegram_interval = 5  # Send updates every 5 seconds
+        # A future resolved by the trade's status events when the order reaches a
+        # final state; the loop below only wakes for that or a periodic update
+        loop = asyncio.get_running_loop()
+        finished = loop.create_future()
 
-        for i in range(timeout):
-            await asyncio.sleep(1)
+        def _on_status(_trade):
+            if not finished.done() and trade.orderStatus.status in _FINAL_STATES:
+                finished.set_result(None)
 
-            status = trade.orderStatus.status
+        trade.statusEvent += _on_status
 
-            # Check for fill
-            if status == "Filled":
-                # Cancel market data subscription
-                if ticker:
-                    try:
-                        self.ib.cancelMktData(contract)
-                    except:
-                        pass
-                return True
+        started = loop.time()
+        deadline = started + timeout
+        telegram_interval = 5  # Send updates every 5 seconds
+        next_update = started + telegram_interval
 
-            # Check for cancellations/errors
-            if status in ["Cancelled", "ApiCancelled", "Inactive", "PendingCancel"]:
-                print(f"  ✗ Order cancelled: {status}")
-                if trade.log:
-                    # Print last log entry for debugging
-                    last_log = trade.log[-1]
-                    if last_log.message:
-                        print(f"    Reason: {last_log.message}")
+        try:
+            while True:
+                status = trade.orderStatus.status
 
-                # Cancel market data subscription
-                if ticker:
-                    try:
-                        self.ib.cancelMktData(contract)
-                    except:
-                        pass
-                return False
+                # Check for fill
+                if status == "Filled":
+                    return True
+
+                # Check for cancellations/errors
+                if status in _TERMINAL_CANCEL_STATES:
+                    logger.warning("  ✗ Order cancelled: %s", status)
+                    if trade.log:
+                        # Print last log entry for debugging
+                        last_log = trade.log[-1]
+                        if last_log.message:
+                            logger.info("    Reason: %s", last_log.message)
+                    return False
+
+                now = loop.time()
+                if now >= deadline:
+                    break
+
+                await asyncio.wait((finished,), timeout=min(deadline, next_update) - now)
+                if finished.done():
+                    continue  # Final status - handled at the top of the loop
+
+                now = loop.time()
+                if now < next_update or now >= deadline:
+                    continue
+                next_update += telegram_interval
+
+                # Send periodic updates (every 5 seconds)
+                elapsed = int(now - started)
+                status = trade.orderStatus.status
 
-            # Send periodic updates (every 5 seconds)
-            if i > 0 and i % telegram_interval == 0:
                 # Terminal log with current market prices
                 if ticker:
-                    import math
                     bid = ticker.bid if ticker.bid and not math.isnan(ticker.bid) else None
                     ask = ticker.ask if ticker.ask and not math.isnan(ticker.ask) else None
 
                     if bid and ask:
-                        print(f"  ⏳ Waiting for fill... ({i}s elapsed, status: {status})")
-                        print(f"     Market: Bid ${bid:.2f} | Ask ${ask:.2f} | Limit ${limit_price:.2f}")
-                        print(f"     Ticker update: {ticker.time if hasattr(ticker, 'time') else 'live'}")
+                        logger.info("  ⏳ Waiting for fill... (%ss elapsed, status: %s)", elapsed, status)
+                        logger.info("     Market: Bid $%.2f | Ask $%.2f | Limit $%.2f", bid, ask, limit_price)
+                        logger.info("     Ticker update: %s", ticker.time if hasattr(ticker, 'time') else 'live')
                     else:
-                        print(f"  ⏳ Waiting for fill... ({i}s elapsed, status: {status}, market data pending...)")
+                        logger.info("  ⏳ Waiting for fill... (%ss elapsed, status: %s, market data pending...)", elapsed, status)
                 else:
-                    print(f"  ⏳ Waiting for fill... ({i}s elapsed, status: {status})")
+                    logger.info("  ⏳ Waiting for fill... (%ss elapsed, status: %s)", elapsed, status)
 
                 # Telegram update with market analysis
                 # Send updates even if ticker is None (will show "no market data" message)
@@ -2016,36 +2496,38 @@ class ExecutionEngine:
                         limit_price=limit_price,
                         ticker=ticker,  # Can be None - function handles it
                         status=status,
-                        elapsed=i,
+                        elapsed=elapsed,
                         timeout=timeout,
                         order_action=order.action,
                         order_quantity=order.totalQuantity
                     )
-                    last_telegram_update = i
 
-        # Timeout - send final update
-        print(f"  ✗ Order timed out after {timeout}s (status: {trade.orderStatus.status})")
+            # Timeout - send final update
+            logger.warning("  ✗ Order timed out after %ss (status: %s)", timeout, trade.orderStatus.status)
 
-        # Send timeout alert even if ticker is None
-        if notifier and is_limit_order:
-            await self._send_timeout_alert(
-                notifier=notifier,
-                session=session,
-                order_type=order_type,
-                limit_price=limit_price,
-                ticker=ticker,  # Can be None - function handles it
-                final_status=trade.orderStatus.status,
-                order_action=order.action
-            )
+            # Send timeout alert even if ticker is None
+            if notifier and is_limit_order:
+                await self._send_timeout_alert(
+                    notifier=notifier,
+                    session=session,
+                    order_type=order_type,
+                    limit_price=limit_price,
+                    ticker=ticker,  # Can be None - function handles it
+                    final_status=trade.orderStatus.status,
+                    order_action=order.action
+                )
 
-        # Cancel market data subscription
-        if ticker:
-            try:
-                self.ib.cancelMktData(contract)
-            except:
-                pass
+            return False
 
-        return False
+        finally:
+            trade.statusEvent -= _on_status
+
+            # Cancel market data subscription
+            if ticker:
+                try:
+                    self.ib.cancelMktData(contract)
+                except:
+                    pass
 
     async def _send_fill_status_update(
         self,
@@ -2062,8 +2544,6 @@ class ExecutionEngine:
     ):
         """Send real-time fill status update to Telegram."""
         try:
-            import math
-
             # Get current market prices (handle ticker being None)
             bid = None
             ask = None
@@ -2075,7 +2555,7 @@ class ExecutionEngine:
                 last = ticker.last if ticker.last and not math.isnan(ticker.last) else None
 
             # Build symbol
-            symbol = f"{session.underlying} {session.strike}{session.direction.value[0]}" if session else "Position"
+            symbol = session.display_symbol if session else "Position"
 
             # Build concise message
             text = f"⏳ <b>{symbol}</b> - {order_action} {order_quantity} @ ${limit_price:.2f} ({elapsed}/{timeout}s)\n\n"
@@ -2103,7 +2583,6 @@ class ExecutionEngine:
                 text += f"<i>Live market data unavailable</i>"
             else:
                 # No market data at all
-                from datetime import datetime
                 now_et = datetime.now()  # Approximate ET time
                 hour_et = now_et.hour - 6  # CST to ET approximation
                 if hour_et < 9 or hour_et >= 16:
@@ -2114,7 +2593,7 @@ class ExecutionEngine:
             await notifier.send_message(text)
 
         except Exception as e:
-            print(f"  Warning: Could not send fill status update: {e}")
+            logger.warning("  Warning: Could not send fill status update: %s", e)
 
     async def _send_timeout_alert(
         self,
@@ -2128,8 +2607,6 @@ class ExecutionEngine:
     ):
         """Send timeout alert with explanation to Telegram."""
         try:
-            import math
-
             # Handle ticker being None
             bid = None
             ask = None
@@ -2137,7 +2614,7 @@ class ExecutionEngine:
                 bid = ticker.bid if ticker.bid and not math.isnan(ticker.bid) else None
                 ask = ticker.ask if ticker.ask and not math.isnan(ticker.ask) else None
 
-            symbol = f"{session.underlying} {session.strike}{session.direction.value[0]}" if session else "Position"
+            symbol = session.display_symbol if session else "Position"
 
             # Build concise timeout message
             text = f"⏱️ <b>{symbol}</b> - Order TIMEOUT @ ${limit_price:.2f}\n\n"
@@ -2161,39 +2638,94 @@ class ExecutionEngine:
             await notifier.send_message(text)
 
         except Exception as e:
-            print(f"  Warning: Could not send timeout alert: {e}")
+            logger.warning("  Warning: Could not send timeout alert: %s", e)
 
-    async def get_account_balance(self) -> Optional[float]:
+    async def _cached(
+        self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: float = 0.5, force: bool = False
+    ) -> Any:
         """
-        Get current account balance from IBKR.
+        Return a recent result for key, or await fetch() and remember it (None isn't cached).
 
-        Returns:
-            Account net liquidation value, or None if unavailable
+        force=True skips the cached value and refreshes it.
         """
-        if not self.connected:
-            return None
+        hit = None if force else self._cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            return hit[1]
 
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
         try:
-            # Wait a moment for initial data to populate after connection
-            await asyncio.sleep(1)
+            value = await fetch()
+            if value is not None:
+                self._cache[key] = (time.monotonic(), value)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a failure nobody else awaited isn't logged by the loop
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _account_summary_value(self, tag: str) -> Optional[str]:
+        """
+        First account summary value for tag, or None.
 
-            # Get account values (already populated by ib_insync after connection)
-            account_values = self.ib.accountValues()
+        ib_insync requests the summary once and keeps it updated, so only the
+        first call goes to IBKR. Its fixed tag list can't be narrowed per call.
+        """
+        summary = await self.ib.accountSummaryAsync()
+        return next((item.value for item in summary if item.tag == tag), None)
 
-            # Find NetLiquidation value
-            for item in account_values:
-                if item.tag == 'NetLiquidation':
-                    return float(item.value)
+    async def _wait_for_account_data(self, timeout: float = 3.0) -> bool:
+        """Wait until NetLiquidation has been received. Returns False on timeout."""
+        if self._acct_ready.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._acct_ready.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def get_account_balance(self, force: bool = False) -> Optional[float]:
+        """
+        Get current account balance from IBKR.
 
-            # If not found, try accountSummary
-            account_summary = self.ib.accountSummary()
-            for item in account_summary:
-                if item.tag == 'NetLiquidation':
-                    return float(item.value)
+        Args:
+            force: Bypass the cached value (reused for _BALANCE_TTL seconds)
 
+        Returns:
+            Account net liquidation value, or None if unavailable
+        """
+        if not self.connected:
             return None
-        except Exception as e:
-            print(f"Error getting account balance: {e}")
+
+        return await self._cached("balance", self._fetch_account_balance, ttl=self._BALANCE_TTL, force=force)
+
+    async def _fetch_account_balance(self) -> Optional[float]:
+        """Read NetLiquidation from account values, falling back to the account summary."""
+        try:
+            # Account updates are synced by ib_insync before connect returns;
+            # give a late first update a moment before falling back
+            await self._wait_for_account_data(timeout=2.0)
+
+            net_liq = self._acct.get('NetLiquidation')
+            if net_liq is not None:
+                return float(net_liq)
+
+            # If not found, try accountSummary (requested on first use)
+            net_liq = await self._account_summary_value('NetLiquidation')
+            return float(net_liq) if net_liq is not None else None
+        except Exception:
+            logger.exception("Error getting account balance")
             return None
 
     async def get_unrealized_pnl(self) -> float:
@@ -2207,29 +2739,24 @@ class ExecutionEngine:
             return 0.0
 
         try:
-            # Get account values (already populated by ib_insync after connection)
-            account_values = self.ib.accountValues()
+            unrealized = self._acct.get('UnrealizedPnL')
+            if unrealized is not None:
+                try:
+                    return float(unrealized)
+                except ValueError:
+                    pass
 
-            # Find UnrealizedPnL value
-            for item in account_values:
-                if item.tag == 'UnrealizedPnL':
-                    try:
-                        return float(item.value)
-                    except ValueError:
-                        continue
-
-            # If not found, try accountSummary
-            account_summary = self.ib.accountSummary()
-            for item in account_summary:
-                if item.tag == 'UnrealizedPnL':
-                    try:
-                        return float(item.value)
-                    except ValueError:
-                        continue
+            # If not found, try accountSummary (requested on first use)
+            unrealized = await self._account_summary_value('UnrealizedPnL')
+            if unrealized is not None:
+                try:
+                    return float(unrealized)
+                except ValueError:
+                    pass
 
             return 0.0
-        except Exception as e:
-            print(f"Error getting unrealized P&L: {e}")
+        except Exception:
+            logger.exception("Error getting unrealized P&L")
             return 0.0
 
     def get_cash_details(self) -> Optional[dict]:
@@ -2260,41 +2787,28 @@ class ExecutionEngine:
                 'BuyingPower': 'buying_power',
             }
 
-            # Get account values (cached, doesn't require async)
-            try:
-                account_values = self.ib.accountValues()
+            # Extract values from the account update index
+            for tag, key in tags_to_find.items():
+                value = self._acct.get(tag)
+                if value is None:
+                    continue
+                try:
+                    cash_info[key] = float(value)
+                except (ValueError, TypeError):
+                    cash_info[key] = None
 
-                # Extract values from account data
-                for item in account_values:
+            # If any values missing, fall back to an already-loaded account summary.
+            # ib.accountSummary() would block to request it, which fails inside the
+            # running loop, so read ib_insync's cached copy instead
+            if len(cash_info) < len(tags_to_find):
+                for item in self.ib.wrapper.acctSummary.values():
                     if item.tag in tags_to_find:
                         key = tags_to_find[item.tag]
-                        try:
-                            cash_info[key] = float(item.value)
-                        except (ValueError, TypeError):
-                            cash_info[key] = None
-            except RuntimeError as e:
-                if "event loop" in str(e).lower():
-                    # Event loop conflict - use alternative approach
-                    return None
-                raise
-
-            # If any values missing, try accountSummary as fallback
-            if len(cash_info) < len(tags_to_find):
-                try:
-                    account_summary = self.ib.accountSummary()
-                    for item in account_summary:
-                        if item.tag in tags_to_find:
-                            key = tags_to_find[item.tag]
-                            if key not in cash_info or cash_info[key] is None:
-                                try:
-                                    cash_info[key] = float(item.value)
-                                except (ValueError, TypeError):
-                                    cash_info[key] = None
-                except RuntimeError as e:
-                    if "event loop" in str(e).lower():
-                        # Return what we have so far
-                        return cash_info if cash_info else None
-                    raise
+                        if key not in cash_info or cash_info[key] is None:
+                            try:
+                                cash_info[key] = float(item.value)
+                            except (ValueError, TypeError):
+                                cash_info[key] = None
 
             return cash_info if cash_info else None
 
@@ -2305,53 +2819,52 @@ class ExecutionEngine:
     async def _display_account_balance(self):
         """Display account balance and cash details on connection."""
         try:
-            # Give IBKR extra time to populate account data after connection
-            await asyncio.sleep(2)
+            await self._wait_for_account_data()
 
             # Get detailed cash info (critical for Cash accounts)
             try:
                 cash_details = self.get_cash_details()
             except Exception as e:
-                print(f"Warning: Could not fetch cash details: {e}")
+                logger.warning("Warning: Could not fetch cash details: %s", e)
                 cash_details = None
 
             if cash_details:
-                print("=" * 60)
-                print("💰 ACCOUNT SUMMARY")
-                print("=" * 60)
+                logger.info("=" * 60)
+                logger.info("💰 ACCOUNT SUMMARY")
+                logger.info("=" * 60)
 
                 net_liq = cash_details.get('net_liquidation')
                 if net_liq:
-                    print(f"Total Value:      ${net_liq:,.2f}")
+                    logger.info(f"Total Value:      ${net_liq:,.2f}")
 
                 available = cash_details.get('available_funds')
                 if available is not None:
-                    print(f"Available Cash:   ${available:,.2f}")
+                    logger.info(f"Available Cash:   ${available:,.2f}")
 
                 settled = cash_details.get('settled_cash')
                 if settled is not None and settled != available:
-                    print(f"Settled Cash:     ${settled:,.2f}  (T+1 settlement)")
+                    logger.info(f"Settled Cash:     ${settled:,.2f}  (T+1 settlement)")
 
                 total_cash = cash_details.get('total_cash')
                 if total_cash is not None and total_cash != available:
-                    print(f"Total Cash:       ${total_cash:,.2f}  (includes unsettled)")
+                    logger.info(f"Total Cash:       ${total_cash:,.2f}  (includes unsettled)")
 
                 buying_power = cash_details.get('buying_power')
                 if buying_power is not None:
-                    print(f"Buying Power:     ${buying_power:,.2f}")
+                    logger.info(f"Buying Power:     ${buying_power:,.2f}")
 
-                print("=" * 60)
+                logger.info("=" * 60)
 
             else:
                 # Fallback to simple balance display
                 balance = await self.get_account_balance()
                 if balance:
-                    print(f"Account Balance: ${balance:,.2f}")
+                    logger.info(f"Account Balance: ${balance:,.2f}")
                 else:
-                    print("Account Balance: Unable to retrieve (data may not be ready yet)")
+                    logger.info("Account Balance: Unable to retrieve (data may not be ready yet)")
 
         except Exception as e:
-            print(f"Could not retrieve account info: {e}")
+            logger.info("Could not retrieve account info: %s", e)
 
     async def get_positions(self) -> list:
         """
@@ -2364,11 +2877,11 @@ class ExecutionEngine:
             return []
 
         try:
-            await asyncio.sleep(1)  # Wait for data to populate
+            # Kept live by ib_insync (synced at connect, updated on every change)
             positions = self.ib.positions()
             return positions
-        except Exception as e:
-            print(f"Error getting positions: {e}")
+        except Exception:
+            logger.exception("Error getting positions")
             return []
 
     async def get_open_orders(self) -> list:
@@ -2382,48 +2895,78 @@ class ExecutionEngine:
             return []
 
         try:
-            await asyncio.sleep(1)  # Wait for data to populate
+            # Kept live by ib_insync (synced at connect, updated on every change)
             open_orders = self.ib.openTrades()
             return open_orders
-        except Exception as e:
-            print(f"Error getting open orders: {e}")
+        except Exception:
+            logger.exception("Error getting open orders")
             return []
 
     async def display_account_status(self):
         """Display complete account status: balance, positions, and open orders."""
-        print("\n" + "="*60)
-        print("IBKR ACCOUNT STATUS")
-        print("="*60)
+        # Nothing changed since the last report - print it again
+        if not self._status_dirty and self._status_report is not None:
+            logger.info(self._status_report)
+            return
+
+        # Cleared before fetching so a change arriving mid-build marks it dirty again
+        self._status_dirty = False
+
+        # Fetch all three together; one failing doesn't lose the others
+        balance, positions, open_orders = await asyncio.gather(
+            self.get_account_balance(),
+            self.get_positions(),
+            self.get_open_orders(),
+            return_exceptions=True,
+        )
+        if isinstance(balance, Exception):
+            logger.error("Error getting account balance", exc_info=balance)
+            balance = None
+        if isinstance(positions, Exception):
+            logger.error("Error getting positions", exc_info=positions)
+            positions = []
+            self._status_dirty = True
+        if isinstance(open_orders, Exception):
+            logger.error("Error getting open orders", exc_info=open_orders)
+            open_orders = []
+            self._status_dirty = True
+        if balance is None:
+            # Don't keep reprinting "Unable to retrieve"
+            self._status_dirty = True
+
+        # Build the report and log it as one record so it stays contiguous
+        lines = ["", "="*60, "IBKR ACCOUNT STATUS", "="*60]
 
         # Balance
-        balance = await self.get_account_balance()
         if balance:
-            print(f"\n💰 Account Balance: ${balance:,.2f}")
+            lines.append(f"\n💰 Account Balance: ${balance:,.2f}")
         else:
-            print("\n💰 Account Balance: Unable to retrieve")
+            lines.append("\n💰 Account Balance: Unable to retrieve")
 
         # Positions
-        positions = await self.get_positions()
-        print(f"\n📊 Current Positions ({len(positions)}):")
+        lines.append(f"\n📊 Current Positions ({len(positions)}):")
         if positions:
             for pos in positions:
                 contract = pos.contract
-                symbol = contract.localSymbol if hasattr(contract, 'localSymbol') else contract.symbol
-                print(f"  • {symbol}: {pos.position} contracts @ avg ${pos.avgCost:.2f}")
+                symbol = getattr(contract, 'localSymbol', None) or contract.symbol
+                lines.append(_POS_FMT(symbol=symbol, qty=pos.position, cost=pos.avgCost))
         else:
-            print("  No open positions")
+            lines.append("  No open positions")
 
         # Open Orders
-        open_orders = await self.get_open_orders()
-        print(f"\n📋 Open Orders ({len(open_orders)}):")
+        lines.append(f"\n📋 Open Orders ({len(open_orders)}):")
         if open_orders:
             for trade in open_orders:
                 contract = trade.contract
                 order = trade.order
-                symbol = contract.localSymbol if hasattr(contract, 'localSymbol') else contract.symbol
-                status = trade.orderStatus.status
-                print(f"  • {order.action} {order.totalQuantity} {symbol} @ ${order.lmtPrice:.2f} - {status}")
+                symbol = getattr(contract, 'localSymbol', None) or contract.symbol
+                lines.append(_ORD_FMT(
+                    action=order.action, qty=order.totalQuantity, symbol=symbol,
+                    px=order.lmtPrice, status=trade.orderStatus.status,
+                ))
         else:
-            print("  No open orders")
+            lines.append("  No open orders")
 
-        print("="*60 + "\n")
+        lines.append("="*60 + "\n")
+        self._status_report = "\n".join(lines)
+        logger.info(self._status_report)
@@ -2,5 +2,12 @@
 
 from .trade_logger import TradeLogger, get_logger, init_logger
 from .daily_snapshot import DailySnapshotManager
+from .console import setup_console_logging
 
-__all__ = ["TradeLogger", "get_logger", "init_logger", "DailySnapshotManager"]
+__all__ = [
+    "TradeLogger",
+    "get_logger",
+    "init_logger",
+    "DailySnapshotManager",
+    "setup_console_logging",
+]
@@ -0,0 +1,52 @@
+"""
+Non-blocking console logging.
+
+Modules log through standard `logging.getLogger(__name__)` loggers. This
+module wires the package's root logger to a QueueHandler so the calling
+thread (usually the asyncio event loop) only formats and enqueues the
+record; a QueueListener thread does the blocking stdout write.
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# Top-level package name ("src"), so every module logger inherits the handler
+PACKAGE_LOGGER = __name__.split(".")[0]
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_console_logging(level: int = logging.INFO) -> logging.Logger:
+    """
+    Route package log records to stdout via a background thread.
+
+    Safe to call more than once - only the first call installs handlers.
+    Output format is the bare message, matching the existing console prints.
+    """
+    global _listener
+
+    package_logger = logging.getLogger(PACKAGE_LOGGER)
+    package_logger.setLevel(level)
+
+    if _listener is not None:
+        return package_logger
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    package_logger.addHandler(QueueHandler(log_queue))
+    package_logger.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+    # Drain pending records on interpreter shutdown
+    atexit.register(_listener.stop)
+
+    return package_logger
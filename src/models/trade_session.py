@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from functools import cached_property
 from typing import Optional
 from pydantic import BaseModel, Field
 from .enums import SessionState, Direction
@@ -87,6 +88,12 @@ class TradeSession(BaseModel):
             datetime: lambda v: v.isoformat(),
         }
 
+    @cached_property
+    def display_symbol(self) -> str:
+        """Short contract label, e.g. "SPY 600.0C" (trade definition never changes)."""
+        right = self.direction.value[0] if self.direction else "?"
+        return f"{self.underlying} {self.strike}{right}"
+
     def add_event(self, event: Event) -> None:
         """Add an event to this session and update state."""
         event.session_id = self.session_id
@@ -13,7 +13,7 @@ from ..execution.executor import OrderResult
 from ..discord_listener import DiscordListener
 from .session_manager import SessionManager
 from ..models import Event, EventType, SessionState, TradeSession
-from ..logging import init_logger, get_logger, DailySnapshotManager
+from ..logging import init_logger, get_logger, DailySnapshotManager, setup_console_logging
 from ..notifications import init_notifier, get_notifier
 
 # Optional psutil for system monitoring
@@ -450,35 +450,19 @@ class TradingOrchestrator:
             # Positions
             text += f"<b>🔓 Open Positions ({len(positions)}):</b>\n"
             if positions:
+                # Current prices for all positions under one shared deadline for live P&L
                 for pos in positions:
+                    pos.contract.exchange = "SMART"  # Required by IBKR for market data
+                current_prices = await self.executor._get_market_prices([pos.contract for pos in positions])
+
+                for pos, current_price in zip(positions, current_prices):
                     contract = pos.contract
-                    symbol = contract.localSymbol if hasattr(contract, 'localSymbol') else contract.symbol
+                    symbol = getattr(contract, 'localSymbol', None) or contract.symbol
                     qty = pos.position
                     avg_cost = pos.avgCost
 
-                    # Get current market price for live P&L
-                    current_price = None
                     pnl_text = ""
                     try:
-                        # Set exchange for market data request (required by IBKR)
-                        contract.exchange = "SMART"
-
-                        # Request market data snapshot
-                        ticker = self.executor.ib.reqMktData(contract, snapshot=True)
-                        await asyncio.sleep(0.5)  # Wait for market data
-
-                        import math
-                        # Try to get current price from market data
-                        if ticker.last and not math.isnan(ticker.last):
-                            current_price = ticker.last
-                        elif ticker.bid and ticker.ask and not math.isnan(ticker.bid) and not math.isnan(ticker.ask):
-                            current_price = (ticker.bid + ticker.ask) / 2  # Use midpoint
-                        elif ticker.close and not math.isnan(ticker.close):
-                            current_price = ticker.close
-
-                        # Cancel market data subscription
-                        self.executor.ib.cancelMktData(contract)
-
                         # Calculate P&L if we have current price
                         if current_price and avg_cost > 0 and abs(qty) > 0:
                             # For options: current_price is premium, avg_cost is already in dollars
@@ -524,7 +508,7 @@ class TradingOrchestrator:
                     for trade in entry_orders:
                         contract = trade.contract
                         order = trade.order
-                        symbol = contract.localSymbol if hasattr(contract, 'localSymbol') else contract.symbol
+                        symbol = getattr(contract, 'localSymbol', None) or contract.symbol
                         action = order.action
                         qty = order.totalQuantity
                         price = order.lmtPrice if order.lmtPrice else order.auxPrice
@@ -537,7 +521,7 @@ class TradingOrchestrator:
                     for trade in stop_orders:
                         contract = trade.contract
                         order = trade.order
-                        symbol = contract.localSymbol if hasattr(contract, 'localSymbol') else contract.symbol
+                        symbol = getattr(contract, 'localSymbol', None) or contract.symbol
                         qty = order.totalQuantity
                         price = order.lmtPrice if order.lmtPrice else order.auxPrice
                         status = trade.orderStatus.status
@@ -546,7 +530,7 @@ class TradingOrchestrator:
                     for trade in target_orders:
                         contract = trade.contract
                         order = trade.order
-                        symbol = contract.localSymbol if hasattr(contract, 'localSymbol') else contract.symbol
+                        symbol = getattr(contract, 'localSymbol', None) or contract.symbol
                         qty = order.totalQuantity
                         price = order.lmtPrice if order.lmtPrice else order.auxPrice
                         status = trade.orderStatus.status
@@ -829,6 +813,7 @@ class TradingOrchestrator:
                             session_to_close.total_quantity = 0
                             session_to_close.exit_price = fill_price
                             session_to_close.realized_pnl = pnl if hasattr(contract, 'strike') else 0
+                            self.executor.release_session_brackets(session_to_close)
                     else:
                         text += f"  ⚠️ Close order timed out\n"
                         failed_count += 1
@@ -893,6 +878,13 @@ class TradingOrchestrator:
                 self.logger.log_error(None, "PARSING_ERROR", str(e))
                 return
 
+            # Redelivered or edited message that already traded: stop before
+            # correlation so it can't open a new session or bump an existing one
+            if self.executor.executed_result(event) is not None:
+                print(f"ⓘ {event.event_type} for message {message_id} already executed")
+                print("  ACTION: NO TRADE (duplicate message)")
+                return
+
             # Step 2: Correlate to session
             print("\n[2/5] Correlating to trade session...")
             session = self.session_manager.process_event(event)
@@ -1182,7 +1174,7 @@ class TradingOrchestrator:
             )
 
         # Log to console
-        symbol = f"{session.underlying} {session.strike}{session.direction.value[0] if session.direction else '?'}"
+        symbol = session.display_symbol
         exit_type = "STOP LOSS" if event_type == EventType.SL else "TAKE PROFIT"
         print(f"\n{'='*60}")
         print(f"{exit_type} FILLED: {symbol}")
@@ -1402,6 +1394,7 @@ class TradingOrchestrator:
                         # Cancel any open bracket orders
                         if session.stop_order_id or session.target_order_ids:
                             await self._cancel_session_brackets(session)
+                        self.executor.release_session_brackets(session)
 
                         # Log closure
                         self.logger.log_session_closed(
@@ -1451,6 +1444,7 @@ class TradingOrchestrator:
                         session.closed_at = datetime.now(timezone.utc)
                         session.exit_reason = f"STALE_{old_state.value}_CLEANUP"
                         session.total_quantity = 0
+                        self.executor.release_session_brackets(session)
 
                         # Log closure
                         self.logger.log_session_closed(
@@ -1581,14 +1575,14 @@ class TradingOrchestrator:
         for session in open_sessions:
             try:
                 # Build contract
-                contract = self.executor._build_contract_from_session(session)
-                qualified = await self.executor.ib.qualifyContractsAsync(contract)
+                contract = self.executor._build_contract(session)
+                qualified = await self.executor._qualify(contract)
 
                 if not qualified:
                     print(f"  ⚠️ Could not qualify contract for {session.underlying} {session.strike}")
                     continue
 
-                contract = qualified[0]
+                contract = qualified
 
                 # Cancel existing brackets
                 await self._cancel_session_brackets(session)
@@ -1611,6 +1605,7 @@ class TradingOrchestrator:
                     session.exit_price = fill_price
                     session.realized_pnl = pnl
                     session.total_quantity = 0
+                    self.executor.release_session_brackets(session)
 
                     print(f"  ✓ Closed {session.underlying} {session.strike} @ ${fill_price:.2f} | P&L: ${pnl:+,.2f}")
 
@@ -1649,6 +1644,9 @@ async def main():
     # Load environment variables
     load_dotenv()
 
+    # Console logging off the event loop (QueueHandler -> background thread)
+    setup_console_logging()
+
     # Build config (in production, load from YAML)
     config = {
         "anthropic_api_key": os.getenv("ANTHROPIC_API_KEY"),
@@ -1722,4 +1720,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Optional uvloop event loop (libuv) - must be installed before asyncio.run
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
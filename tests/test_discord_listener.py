@@ -0,0 +1,175 @@
+"""
+Tests for the Discord gateway listener's raw-frame handling.
+
+Frames below follow the shape of real gateway dispatches (compact JSON,
+envelope keys t/s/op before d).
+"""
+
+import asyncio
+
+import orjson
+
+from src.discord_listener import DiscordSimpleListener
+
+
+def _frame(event_type: str, seq: int, data: str) -> str:
+    return f'{{"t":"{event_type}","s":{seq},"op":0,"d":{data}}}'
+
+
+def test_frame_sequence_reads_top_level_s():
+    """The envelope sequence wins over any nested "s" key, in either layout."""
+    nested = '{"id":"1","channel_id":"111","embeds":[{"s":7}]}'
+
+    assert DiscordSimpleListener._frame_sequence(_frame("MESSAGE_CREATE", 42, nested)) == 42
+    assert DiscordSimpleListener._frame_sequence(
+        f'{{"op":0,"d":{nested},"s":43,"t":"MESSAGE_CREATE"}}'
+    ) == 43
+    assert DiscordSimpleListener._frame_sequence(
+        '{"t": "MESSAGE_CREATE", "s": 44, "op": 0, "d": {}}'
+    ) == 44
+
+
+# Trimmed MESSAGE_CREATE / MESSAGE_UPDATE payloads as sent by the gateway
+_MESSAGE = (
+    '{"type":0,"tts":false,"timestamp":"2025-12-12T14:31:07.512000+00:00",'
+    '"pinned":false,"mentions":[],"mention_roles":[],"mention_everyone":false,'
+    '"id":"1448912000000000001","flags":0,"embeds":[],"edited_timestamp":null,'
+    '"content":"bought SPY 685C @ 0.43","components":[],"channel_id":"%s",'
+    '"author":{"username":"%s","public_flags":0,"id":"90000000000000001",'
+    '"global_name":"Trader","discriminator":"0","avatar":null},'
+    '"attachments":[],"guild_id":"80000000000000001"}'
+)
+_EMBED_UPDATE = (
+    '{"id":"1448912000000000001","embeds":[{"type":"link","url":"https://x.test"}],'
+    '"channel_id":"%s","guild_id":"80000000000000001"}'
+)
+
+CHANNEL = "111111111111111111"
+OTHER_CHANNEL = "222222222222222222"
+
+
+def _listener(users=None, callback=None) -> DiscordSimpleListener:
+    return DiscordSimpleListener(
+        token="test-token",
+        channel_ids=[int(CHANNEL)],
+        monitored_users=users,
+        message_callback=callback,
+    )
+
+
+def test_skip_frame_non_message_events_pass():
+    """READY, heartbeats and other dispatches are never filtered."""
+    listener = _listener(users=["trader"])
+
+    assert not listener._should_skip_frame('{"t":null,"s":null,"op":11,"d":null}')
+    assert not listener._should_skip_frame(_frame("READY", 1, '{"session_id":"abc"}'))
+    assert not listener._should_skip_frame(_frame("TYPING_START", 2, '{"channel_id":"%s"}' % OTHER_CHANNEL))
+
+
+def test_skip_frame_channel_needle():
+    listener = _listener()
+
+    assert not listener._should_skip_frame(_frame("MESSAGE_CREATE", 3, _MESSAGE % (CHANNEL, "trader")))
+    assert listener._should_skip_frame(_frame("MESSAGE_CREATE", 3, _MESSAGE % (OTHER_CHANNEL, "trader")))
+
+
+def test_skip_frame_user_needle():
+    listener = _listener(users=["trader", "spxbot_ü"])
+
+    assert not listener._should_skip_frame(_frame("MESSAGE_CREATE", 4, _MESSAGE % (CHANNEL, "trader")))
+    assert listener._should_skip_frame(_frame("MESSAGE_CREATE", 4, _MESSAGE % (CHANNEL, "someone_else")))
+    # Non-ASCII usernames match whether sent raw or \u-escaped
+    assert not listener._should_skip_frame(_frame("MESSAGE_CREATE", 4, _MESSAGE % (CHANNEL, "spxbot_ü")))
+    assert not listener._should_skip_frame(_frame("MESSAGE_CREATE", 4, _MESSAGE % (CHANNEL, "spxbot_\\u00fc")))
+
+
+def test_skip_frame_content_needle_on_update():
+    """Edits without content (embed unfurls) are skipped; real edits pass."""
+    listener = _listener()
+
+    assert listener._should_skip_frame(_frame("MESSAGE_UPDATE", 5, _EMBED_UPDATE % CHANNEL))
+    assert not listener._should_skip_frame(_frame("MESSAGE_UPDATE", 5, _MESSAGE % (CHANNEL, "trader")))
+    # Creates are never skipped for a missing content key (filtered after parse)
+    assert not listener._should_skip_frame(_frame("MESSAGE_CREATE", 5, _EMBED_UPDATE % CHANNEL))
+
+
+def test_skip_frame_passes_unrecognised_layouts():
+    """Whitespace or reordered keys must fall through to the full parse, not be dropped."""
+    listener = _listener(users=["trader"])
+    spaced = (
+        '{"t": "MESSAGE_CREATE", "s": 6, "op": 0, "d": {"content": "bought SPY 685C @ 0.43", '
+        '"channel_id": "%s", "author": {"username": "trader"}}}' % CHANNEL
+    )
+    spaced_fields = _frame(
+        "MESSAGE_CREATE", 6,
+        '{"content":"bought SPY 685C @ 0.43","channel_id": "%s","author":{"username": "trader"}}' % CHANNEL,
+    )
+    reordered = '{"d":%s,"op":0,"s":6,"t":"MESSAGE_CREATE"}' % (_MESSAGE % (CHANNEL, "trader"))
+
+    assert not listener._should_skip_frame(spaced)
+    assert not listener._should_skip_frame(spaced_fields)
+    assert not listener._should_skip_frame(reordered)
+
+
+def test_handle_message_dispatches_monitored_messages():
+    """Parsed messages from monitored channels/users reach the callback; others don't."""
+    received = []
+
+    async def callback(message, author, message_id, timestamp):
+        received.append((message, author, message_id, timestamp.isoformat()))
+
+    async def run():
+        listener = _listener(users=["trader"], callback=callback)
+        for channel, user in ((CHANNEL, "trader"), (OTHER_CHANNEL, "trader"), (CHANNEL, "someone_else")):
+            await listener._handle_gateway_event(orjson.loads(_frame("MESSAGE_CREATE", 7, _MESSAGE % (channel, user))))
+        bot = orjson.loads(_MESSAGE % (CHANNEL, "trader"))
+        bot["author"]["bot"] = True
+        await listener._handle_message(bot)
+        await asyncio.gather(*listener._callback_tasks)
+        return listener
+
+    listener = asyncio.run(run())
+
+    assert received == [(
+        "bought SPY 685C @ 0.43",
+        "trader",
+        "1448912000000000001",
+        "2025-12-12T14:31:07.512000+00:00",
+    )]
+    assert listener.sequence == 7
+
+
+def test_http_session_created_lazily():
+    """REST helpers work before start(): the session is built on first use and reused."""
+
+    async def run():
+        listener = _listener()
+        assert listener.http_session is None
+        session = listener._get_http_session()
+        assert listener._get_http_session() is session
+        await listener.stop()
+        assert session.closed
+        assert listener._get_http_session() is not session
+        await listener.stop()
+
+    asyncio.run(run())
+
+
+def test_failed_authentication_closes_http_session():
+    """start() giving up on a bad token leaves no open session/connector behind."""
+
+    async def run():
+        listener = _listener()
+
+        async def rejected():
+            listener._get_http_session()
+            return 401
+
+        listener._request_user_info = rejected
+        await listener.start()
+        return listener
+
+    listener = asyncio.run(run())
+
+    assert listener.http_session.closed
+    assert listener.running is False
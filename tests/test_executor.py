@@ -0,0 +1,319 @@
+"""
+Tests for the execution engine.
+
+IBKR calls are replaced with in-process fakes, so no gateway is needed.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+from ib_insync import ContractDetails, Option, Order, Ticker, Trade
+from ib_insync import OrderStatus as IBOrderStatus
+
+from src.execution import ExecutionEngine
+from src.execution.executor import OrderStatus
+from src.models import Event, EventType, Direction, SessionState, TradeSession
+
+
+def _event(event_type=EventType.NEW, message_id="msg_1", **fields) -> Event:
+    base = dict(
+        event_type=event_type,
+        timestamp=datetime.now(timezone.utc),
+        author="test_trader",
+        message_id=message_id,
+        underlying="SPY",
+        direction=Direction.CALL,
+        strike=685.0,
+        expiry="2025-12-12",
+        entry_price=0.43,
+        raw_message="bought SPY 685C @ 0.43",
+    )
+    base.update(fields)
+    return Event(**base)
+
+
+def _session(event: Event) -> TradeSession:
+    now = datetime.now(timezone.utc)
+    return TradeSession(
+        session_id="sess-0001",
+        author=event.author,
+        underlying=event.underlying,
+        direction=event.direction,
+        strike=event.strike,
+        expiry=event.expiry,
+        created_at=now,
+        updated_at=now,
+        entry_event=event,
+    )
+
+
+def _engine() -> ExecutionEngine:
+    engine = ExecutionEngine()
+    engine.connected = True
+    return engine
+
+
+def test_entry_reports_both_expiries_when_0dte_retry_fails():
+    """An unknown contract on both expiries is rejected with both in the message."""
+    engine = _engine()
+    requested = []
+
+    async def no_details(contract):
+        requested.append(contract.lastTradeDateOrContractMonth)
+        return []
+
+    engine.ib.reqContractDetailsAsync = no_details
+
+    event = _event()
+    result = asyncio.run(engine.execute_event(event, _session(event), 1))
+
+    today = engine._today_ibkr()
+    assert result.success is False
+    assert result.status == OrderStatus.REJECTED
+    assert result.message.startswith("Contract not found")
+    assert f"tried expiries: {event.expiry}, {today}" in result.message
+    assert requested == ["20251212", today]
+
+
+def _qualifying_engine(min_tick: float = 0.01) -> ExecutionEngine:
+    """Engine whose contract lookups resolve to a fixed SPY option (conId 42)."""
+    engine = _engine()
+
+    async def details(contract):
+        qualified = Option(
+            contract.symbol, contract.lastTradeDateOrContractMonth, contract.strike,
+            contract.right, "CBOE", conId=42, localSymbol="SPY   251212C00685000",
+        )
+        return [ContractDetails(contract=qualified, minTick=min_tick)]
+
+    engine.ib.reqContractDetailsAsync = details
+    return engine
+
+
+def test_exit_does_not_oversell_when_bracket_fills_during_cancel():
+    """A stop that fills before its cancel lands leaves nothing for the EXIT to sell."""
+    engine = _qualifying_engine()
+    event = _event()
+    session = _session(event)
+    session.state = SessionState.OPEN
+    session.total_quantity = 2
+
+    stop = Trade(
+        contract=Option("SPY", "20251212", 685.0, "C", "SMART"),
+        order=Order(orderId=7, action="SELL", totalQuantity=2),
+        orderStatus=IBOrderStatus(status="Submitted"),
+    )
+    placed = []
+
+    def cancel(order):
+        # The fill crosses the cancel on the wire
+        stop.orderStatus.status = "Filled"
+        stop.orderStatus.filled = 2
+        stop.statusEvent.emit(stop)
+
+    engine.ib.openTrades = lambda: [stop]
+    engine.ib.cancelOrder = cancel
+    engine.ib.placeOrder = lambda contract, order: placed.append(order)
+
+    result = asyncio.run(engine.execute_event(_event(EventType.EXIT, "msg_2"), session, 0))
+
+    assert placed == []
+    assert result.success is False
+    assert "bracket filled before cancel" in result.message
+
+
+def _filling_broker(engine: ExecutionEngine, fill_price: float = 0.55) -> list:
+    """Fake placeOrder that fills every order at once; returns the list of placed orders."""
+    placed = []
+
+    def place(contract, order):
+        placed.append(order)
+        return Trade(
+            contract=contract,
+            order=Order(orderId=100 + len(placed), action=order.action, totalQuantity=order.totalQuantity),
+            orderStatus=IBOrderStatus(status="Filled", filled=order.totalQuantity, avgFillPrice=fill_price),
+        )
+
+    engine.ib.openTrades = lambda: []
+    engine.ib.placeOrder = place
+    return placed
+
+
+def _open_session(quantity: int = 1) -> TradeSession:
+    session = _session(_event())
+    session.state = SessionState.OPEN
+    session.total_quantity = quantity
+    session.avg_entry_price = 0.43
+    return session
+
+
+def test_redelivered_event_is_executed_once():
+    """The same message/event pair places one order and returns the first result again."""
+    engine = _qualifying_engine()
+    placed = _filling_broker(engine)
+    exit_event = _event(EventType.EXIT, "msg_9")
+
+    async def run():
+        first = await engine.execute_event(exit_event, _open_session(), 0)
+        again = await engine.execute_event(exit_event, _open_session(), 0)
+        return first, again
+
+    first, again = asyncio.run(run())
+
+    assert first.success is True
+    assert again is first
+    assert len(placed) == 1
+    assert list(engine.submitted_orders) == ["msg_9:EXIT"]
+
+
+def test_submitted_orders_keeps_only_the_most_recent():
+    """The idempotency record is capped, dropping the oldest message first."""
+    engine = _qualifying_engine()
+    placed = _filling_broker(engine)
+    engine._SUBMITTED_MAX = 2
+
+    async def run():
+        for message_id in ("msg_a", "msg_b", "msg_c"):
+            await engine.execute_event(_event(EventType.EXIT, message_id), _open_session(), 0)
+        # msg_a was evicted, so a redelivery now trades again
+        await engine.execute_event(_event(EventType.EXIT, "msg_a"), _open_session(), 0)
+
+    asyncio.run(run())
+
+    assert len(placed) == 4
+    assert list(engine.submitted_orders) == ["msg_c:EXIT", "msg_a:EXIT"]
+
+
+def test_session_pnl_is_whole_cents():
+    """P&L comes out in exact cents, including fractional-cent averages after ADDs."""
+    engine = _engine()
+    session = _open_session(quantity=3)
+
+    # 0.1 + 0.2 style float noise must not leak into the result
+    session.avg_entry_price = 0.43
+    assert engine._calculate_session_pnl(session, 0.72) == 87.0
+    assert engine._calculate_session_pnl(session, 0.38) == -15.0
+
+    # Average of 0.43 and 2 x 0.35 after an ADD: 0.37666... per contract
+    session.avg_entry_price = (0.43 + 2 * 0.35) / 3
+    assert engine._calculate_session_pnl(session, 0.50) == 37.0
+
+    session.total_quantity = 0
+    assert engine._calculate_session_pnl(session, 0.50) == 0.0
+
+
+def test_bracket_prices_snap_to_contract_tick():
+    """Qualifying records minTick; stop/target prices round to it (0.01 when unknown)."""
+    engine = _qualifying_engine(min_tick=0.05)
+    contract = asyncio.run(engine._qualify(Option("SPY", "20251212", 685.0, "C", "SMART")))
+
+    assert engine._min_ticks == {42: 0.05}
+    assert engine._round_to_tick(1.23, contract) == 1.25
+    assert engine._round_to_tick(1.21, contract) == 1.2
+    assert engine._round_to_tick(0.4349, contract) == 0.45
+    assert engine._round_to_tick(1.234) == 1.23
+    assert engine._round_to_tick(1.234, Option(conId=99)) == 1.23
+
+    # Auto stop 50% below fill, target at 0.6R: 1.10 -> 0.55 / 1.43 (1.45 on a 0.05 tick)
+    assert engine._calculate_bracket_prices(1.10, None, None, contract) == (0.55, 1.45)
+    assert engine._calculate_bracket_prices(1.10, None, None) == (0.55, 1.43)
+
+
+def test_market_prices_keep_partial_quotes_under_one_deadline():
+    """A contract that never quotes loses only its own price; others use last -> mid -> close."""
+    engine = _engine()
+    contracts = [Option("SPY", "20251212", strike, "C", "SMART") for strike in (684.0, 685.0, 686.0, 687.0)]
+    tickers = {}
+    cancelled = []
+
+    def req(contract, *args, **kwargs):
+        tickers[contract.strike] = Ticker(contract=contract)
+        return tickers[contract.strike]
+
+    engine.ib.reqMktData = req
+    engine.ib.cancelMktData = cancelled.append
+
+    async def run():
+        async def quotes_arrive():
+            await asyncio.sleep(0.05)
+            tickers[684.0].last, tickers[684.0].bid, tickers[684.0].ask = 1.10, 1.00, 1.30
+            tickers[685.0].bid, tickers[685.0].ask = 0.40, 0.50
+            tickers[686.0].close = 0.25  # previous close only; 687 never quotes
+            engine.ib.pendingTickersEvent.emit(set(tickers.values()))
+
+        asyncio.create_task(quotes_arrive())
+        return await engine._get_market_prices(contracts, timeout=0.3)
+
+    prices = asyncio.run(run())
+
+    assert prices[0] == 1.10
+    assert abs(prices[1] - 0.45) < 1e-9
+    assert prices[2] == 0.25
+    assert prices[3] is None
+    assert cancelled == contracts
+
+
+def _acking_broker(engine: ExecutionEngine, statuses: dict) -> list:
+    """Fake placeOrder answering each order type with a fixed status; returns cancelled order IDs."""
+    cancelled = []
+    next_id = iter(range(200, 300))
+
+    def place(contract, order):
+        trade = Trade(contract=contract, order=order, orderStatus=IBOrderStatus(status="PendingSubmit"))
+        order.orderId = next(next_id)
+
+        def ack():
+            trade.orderStatus.status = statuses[order.orderType]
+            trade.statusEvent.emit(trade)
+
+        asyncio.get_running_loop().call_soon(ack)
+        return trade
+
+    engine.ib.placeOrder = place
+    engine.ib.cancelOrder = lambda order: cancelled.append(order.orderId)
+    return cancelled
+
+
+def test_rejected_stop_leaves_no_bracket():
+    """A stop IBKR rejects fails the whole bracket and pulls the accepted target."""
+    engine = _engine()
+    cancelled = _acking_broker(engine, {"STP": "Inactive", "LMT": "Submitted"})
+    contract = Option("SPY", "20251212", 685.0, "C", "SMART")
+
+    result = asyncio.run(engine._create_bracket_orders(contract, 1, 0.25, 0.70, _open_session()))
+
+    assert result is None
+    assert cancelled == [201]
+    assert engine._bracket_trades == {}
+
+
+def test_rejected_target_keeps_the_stop():
+    engine = _engine()
+    cancelled = _acking_broker(engine, {"STP": "PreSubmitted", "LMT": "Inactive"})
+    contract = Option("SPY", "20251212", 685.0, "C", "SMART")
+
+    result = asyncio.run(engine._create_bracket_orders(contract, 1, 0.25, 0.70, _open_session()))
+
+    assert result == {"stop_order_id": 200}
+    assert cancelled == []
+    assert list(engine._bracket_trades) == [200]
+
+
+def test_move_stop_does_not_record_a_rejected_stop():
+    """The old stop is cancelled either way; a rejected replacement leaves the session with none."""
+    engine = _qualifying_engine()
+    _acking_broker(engine, {"STP": "Inactive"})
+    session = _open_session()
+    engine._set_brackets(session, 150, [151])
+
+    async def cancel_siblings(order_ids):
+        pass
+
+    engine._cancel_sibling_orders = cancel_siblings
+    result = asyncio.run(engine.execute_event(_event(EventType.MOVE_STOP, "msg_ms", stop_loss=0.40), session, 0))
+
+    assert result.success is False
+    assert "NO stop" in result.message
+    assert session.stop_order_id is None
+    assert session.target_order_ids == [151]
+    assert 200 not in engine.bracket_index and 200 not in engine._bracket_trades
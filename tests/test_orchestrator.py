@@ -0,0 +1,104 @@
+"""
+Tests for the orchestrator's message pipeline.
+
+The LLM parser, risk gate and broker are stubbed; session correlation and
+the execution engine's bookkeeping are real.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from src.execution.executor import OrderResult, OrderStatus
+from src.models import Event, EventType, Direction, SessionState
+from src.orchestrator.main import TradingOrchestrator
+from src.risk_gate import RiskDecision
+
+
+def _config(log_dir) -> dict:
+    return {
+        "log_dir": str(log_dir),
+        "dry_run": False,
+        "anthropic_api_key": "test-key",
+        "risk": {"account_balance": 10000.0, "max_contracts": 5},
+        "ibkr": {"host": "127.0.0.1", "port": 4002, "client_id": 1},
+        "discord": {"user_token": "test-token", "channel_ids": [111]},
+    }
+
+
+def _event(event_type: EventType, message_id: str) -> Event:
+    return Event(
+        event_type=event_type,
+        timestamp=datetime.now(timezone.utc),
+        author="test_trader",
+        message_id=message_id,
+        underlying="SPY",
+        direction=Direction.CALL,
+        strike=685.0,
+        expiry="2025-12-12",
+        entry_price=0.35,
+        raw_message="adding 1 more @ 0.35",
+        parsing_confidence=0.95,
+    )
+
+
+def _orchestrator(tmp_path) -> TradingOrchestrator:
+    orchestrator = TradingOrchestrator(_config(tmp_path))
+
+    orchestrator.risk_gate = SimpleNamespace(
+        validate=lambda **_: SimpleNamespace(decision=RiskDecision.APPROVE, reason="ok", failed_checks=[]),
+        calculate_position_size=lambda **_: 1,
+        update_account_balance=lambda balance: None,
+    )
+
+    executor = orchestrator.executor
+    executor.connected = True
+
+    async def no_balance(*_args, **_kwargs):
+        return None
+
+    async def no_pnl():
+        return 0.0
+
+    executor.get_account_balance = no_balance
+    executor.get_unrealized_pnl = no_pnl
+    return orchestrator
+
+
+def test_redelivered_message_does_not_touch_the_session_again(tmp_path):
+    """A duplicate ADD is dropped before correlation: one fill, one add, one event on the session."""
+    orchestrator = _orchestrator(tmp_path)
+    executor = orchestrator.executor
+
+    # Existing open position for the ADD to correlate to
+    session = orchestrator.session_manager.process_event(_event(EventType.NEW, "msg_new"))
+    session.state = SessionState.OPEN
+    session.total_quantity = 1
+    session.avg_entry_price = 0.43
+
+    adds = []
+
+    async def fake_add(event, session, quantity):
+        adds.append(event.message_id)
+        return OrderResult(success=True, order_id=101, status=OrderStatus.FILLED, filled_price=0.35)
+
+    executor._execute_add = fake_add
+    orchestrator.parser = SimpleNamespace(
+        parse_message=lambda message, author, message_id, timestamp: _event(EventType.ADD, message_id)
+    )
+
+    async def deliver_twice():
+        for _ in range(2):
+            await orchestrator.on_discord_message(
+                message="adding 1 more @ 0.35",
+                author="test_trader",
+                message_id="msg_add",
+                timestamp=datetime.now(timezone.utc),
+            )
+
+    asyncio.run(deliver_twice())
+
+    assert adds == ["msg_add"]
+    assert session.num_adds == 1
+    assert [e.message_id for e in session.all_events] == ["msg_new", "msg_add"]
+    assert len(orchestrator.session_manager.sessions) == 1